@@ -0,0 +1,22 @@
+// Generated by tools/digits/pack_digit_sheet.py - do not edit.
+#pragma once
+
+#include <pebble.h>
+
+// Size of RESOURCE_ID_DIGIT_SHEET: one column of 10 digits
+#define DIGIT_SHEET_WIDTH 72
+#define DIGIT_SHEET_HEIGHT 840
+
+// Rectangle of each digit 0-9 in the sheet
+static const GRect DIGIT_SHEET_RECTS[10] = {
+  {{0, 0}, {72, 84}},
+  {{0, 84}, {72, 84}},
+  {{0, 168}, {72, 84}},
+  {{0, 252}, {72, 84}},
+  {{0, 336}, {72, 84}},
+  {{0, 420}, {72, 84}},
+  {{0, 504}, {72, 84}},
+  {{0, 588}, {72, 84}},
+  {{0, 672}, {72, 84}},
+  {{0, 756}, {72, 84}}
+};
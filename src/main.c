@@ -1,13 +1,18 @@
 #include <pebble.h>
-
-// Screenshot mode - uncomment and set time for screenshots
-// Format: SCREENSHOT_TIME_24H 1 for 24h mode, 0 for 12h mode
-// Format: SCREENSHOT_HOUR (0-23 for 24h, 1-12 for 12h)
-// Format: SCREENSHOT_MINUTE (0-59)
-// #define SCREENSHOT_MODE
-// #define SCREENSHOT_TIME_24H 1
-// #define SCREENSHOT_HOUR 23
-// #define SCREENSHOT_MINUTE 59
+#include "digit_sheet.h"
+
+// Screenshot mode - build with `SCREENSHOT_MODE=1 pebble build` (see wscript)
+// The displayed time is then set at runtime by an AppMessage from
+// tools/screenshots/capture_emulator.py and persisted, so one build serves
+// every screenshot. Keys must match appKeys in appinfo.json.
+// SCREENSHOT_KEY_HOUR: 0-23
+// SCREENSHOT_KEY_MINUTE: 0-59
+// SCREENSHOT_KEY_24H: 1 for 24h mode, 0 for 12h mode
+#ifdef SCREENSHOT_MODE
+#define SCREENSHOT_KEY_HOUR 0
+#define SCREENSHOT_KEY_MINUTE 1
+#define SCREENSHOT_KEY_24H 2
+#endif
 
 // UI Elements - 4 BitmapLayers for individual digits
 static Window *s_main_window;
@@ -16,22 +21,11 @@ static BitmapLayer *s_hour_ones_layer;
 static BitmapLayer *s_minute_tens_layer;
 static BitmapLayer *s_minute_ones_layer;
 
-// Bitmaps for digits 0-9
-static GBitmap *s_digit_bitmaps[10];
+// Sprite sheet holding all ten digits (see digit_sheet.h)
+static GBitmap *s_digit_sheet;
 
-// Resource IDs for digit bitmaps
-static const uint32_t DIGIT_RESOURCE_IDS[] = {
-  RESOURCE_ID_DIGIT_0,
-  RESOURCE_ID_DIGIT_1,
-  RESOURCE_ID_DIGIT_2,
-  RESOURCE_ID_DIGIT_3,
-  RESOURCE_ID_DIGIT_4,
-  RESOURCE_ID_DIGIT_5,
-  RESOURCE_ID_DIGIT_6,
-  RESOURCE_ID_DIGIT_7,
-  RESOURCE_ID_DIGIT_8,
-  RESOURCE_ID_DIGIT_9
-};
+// Bitmaps for digits 0-9, sub-bitmaps sharing the sheet's pixels
+static GBitmap *s_digit_bitmaps[10];
 
 // Update the time display
 static void update_time() {
@@ -41,10 +35,10 @@ static void update_time() {
   bool use_24h;
 
 #ifdef SCREENSHOT_MODE
-  // Use screenshot mode time
-  use_24h = SCREENSHOT_TIME_24H;
-  hours = SCREENSHOT_HOUR;
-  minutes = SCREENSHOT_MINUTE;
+  // Use the last time sent by the screenshot driver (10:08 until then)
+  use_24h = persist_read_bool(SCREENSHOT_KEY_24H);
+  hours = persist_exists(SCREENSHOT_KEY_HOUR) ? persist_read_int(SCREENSHOT_KEY_HOUR) : 10;
+  minutes = persist_exists(SCREENSHOT_KEY_MINUTE) ? persist_read_int(SCREENSHOT_KEY_MINUTE) : 8;
 #else
   // Get actual time
   time_t temp = time(NULL);
@@ -92,15 +86,33 @@ static void tick_handler(struct tm *tick_time, TimeUnits units_changed) {
   update_time();
 }
 
+#ifdef SCREENSHOT_MODE
+// AppMessage handler - persist the screenshot time and show it
+static void inbox_received_handler(DictionaryIterator *iter, void *context) {
+  Tuple *hour = dict_find(iter, SCREENSHOT_KEY_HOUR);
+  Tuple *minute = dict_find(iter, SCREENSHOT_KEY_MINUTE);
+  Tuple *use_24h = dict_find(iter, SCREENSHOT_KEY_24H);
+  if (!hour || !minute || !use_24h) {
+    return;
+  }
+
+  persist_write_int(SCREENSHOT_KEY_HOUR, hour->value->uint8);
+  persist_write_int(SCREENSHOT_KEY_MINUTE, minute->value->uint8);
+  persist_write_bool(SCREENSHOT_KEY_24H, use_24h->value->uint8);
+  update_time();
+}
+#endif
+
 // Window load handler
 static void main_window_load(Window *window) {
   // Get window information
   Layer *window_layer = window_get_root_layer(window);
   GRect bounds = layer_get_bounds(window_layer);
 
-  // Load all digit bitmaps
+  // Load the digit sheet once and slice it into per-digit bitmaps
+  s_digit_sheet = gbitmap_create_with_resource(RESOURCE_ID_DIGIT_SHEET);
   for (int i = 0; i < 10; i++) {
-    s_digit_bitmaps[i] = gbitmap_create_with_resource(DIGIT_RESOURCE_IDS[i]);
+    s_digit_bitmaps[i] = gbitmap_create_as_sub_bitmap(s_digit_sheet, DIGIT_SHEET_RECTS[i]);
   }
 
   // Calculate quadrant dimensions (2x2 grid)
@@ -169,10 +181,11 @@ static void main_window_unload(Window *window) {
   bitmap_layer_destroy(s_minute_tens_layer);
   bitmap_layer_destroy(s_minute_ones_layer);
 
-  // Unload all digit bitmaps
+  // Unload all digit bitmaps, then the sheet they point into
   for (int i = 0; i < 10; i++) {
     gbitmap_destroy(s_digit_bitmaps[i]);
   }
+  gbitmap_destroy(s_digit_sheet);
 }
 
 // Initialize the app
@@ -194,6 +207,12 @@ static void init() {
 
   // Display the initial time
   update_time();
+
+#ifdef SCREENSHOT_MODE
+  // Receive screenshot times from the capture driver
+  app_message_register_inbox_received(inbox_received_handler);
+  app_message_open(64, 0);
+#endif
 }
 
 // Deinitialize the app
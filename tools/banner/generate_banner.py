@@ -1,11 +1,20 @@
 #!/usr/bin/env python3
 """
 Generate 720×320 app store banner showing all 5 Pebble platforms.
-Requires screenshots to be captured first.
+
+Each platform's watchface is rendered in memory by the screenshot
+compositor, so no screenshots need to exist on disk. Pass
+--from-screenshots to use the PNGs in store-assets/screenshots/ instead
+(e.g. after capturing them from the emulator).
+
+The banner is only rebuilt when its inputs (the digits or screenshots it
+shows and the layout below) changed since the last run; pass --force to
+rebuild.
 """
 
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
+import hashlib
 import sys
 
 
@@ -14,6 +23,17 @@ PROJECT_DIR = Path(__file__).resolve().parent.parent.parent
 SCREENSHOTS_DIR = PROJECT_DIR / "store-assets" / "screenshots"
 OUTPUT_PATH = PROJECT_DIR / "store-assets" / "banner.png"
 
+# Shared screenshot tooling (compositor, render manifest)
+sys.path.insert(0, str(PROJECT_DIR / "tools" / "screenshots"))
+from compositor import parse_time_name, render_image  # noqa: E402
+from digit_atlas import digit_hashes  # noqa: E402
+from generate_screenshots_programmatic import RENDER_VERSION  # noqa: E402
+from manifest import Manifest, input_key  # noqa: E402
+
+# Recorded in the render manifest; bump when the banner design changes
+TOOL_NAME = "generate_banner"
+BANNER_VERSION = 1
+
 # Banner dimensions
 BANNER_WIDTH = 720
 BANNER_HEIGHT = 320
@@ -29,7 +49,48 @@ PLATFORMS = [
 ]
 
 
-def create_banner():
+def banner_key(from_screenshots=False):
+    """
+    Hash the banner's inputs: layout config and version, plus either the
+    digit PNGs and renderer version or the screenshot bytes.
+    """
+    if not from_screenshots:
+        return input_key(TOOL_NAME, BANNER_VERSION, BANNER_WIDTH, BANNER_HEIGHT,
+                         PLATFORMS, digit_hashes(), RENDER_VERSION)
+
+    screenshots = []
+    for platform, _, _, time_name in PLATFORMS:
+        screenshot_path = SCREENSHOTS_DIR / platform / f"{time_name}.png"
+        if screenshot_path.exists():
+            screenshots.append(hashlib.sha256(screenshot_path.read_bytes()).hexdigest())
+        else:
+            screenshots.append(None)
+    return input_key(TOOL_NAME, BANNER_VERSION, BANNER_WIDTH, BANNER_HEIGHT,
+                     PLATFORMS, screenshots)
+
+
+def load_screenshot(platform, time_name, from_screenshots=False):
+    """
+    Return the watchface image for a platform and time.
+
+    Rendered in memory unless from_screenshots is set, in which case the
+    PNG is read from store-assets/screenshots/<platform>/.
+
+    Returns:
+        PIL image, or None if the screenshot file does not exist
+    """
+    if not from_screenshots:
+        hour, minute, is_24h = parse_time_name(time_name)
+        return render_image(platform, hour, minute, is_24h, depth="rgb")
+
+    screenshot_path = SCREENSHOTS_DIR / platform / f"{time_name}.png"
+    if not screenshot_path.exists():
+        print(f"  Warning: {screenshot_path} not found, skipping {platform}")
+        return None
+    return Image.open(screenshot_path)
+
+
+def create_banner(from_screenshots=False):
     """Create the banner image."""
     print("Creating 720×320 app store banner...")
 
@@ -49,15 +110,11 @@ def create_banner():
     successful_screenshots = []
 
     for platform, name, (orig_w, orig_h), time_name in PLATFORMS:
-        screenshot_path = SCREENSHOTS_DIR / platform / f"{time_name}.png"
-
-        if not screenshot_path.exists():
-            print(f"  Warning: {screenshot_path} not found, skipping {platform}")
-            continue
-
         try:
             # Load screenshot
-            img = Image.open(screenshot_path)
+            img = load_screenshot(platform, time_name, from_screenshots)
+            if img is None:
+                continue
 
             # Scale to fit width while maintaining aspect ratio
             scale = platform_width / img.width
@@ -136,12 +193,24 @@ def create_banner():
 
 
 def main():
-    if not SCREENSHOTS_DIR.exists():
+    from_screenshots = "--from-screenshots" in sys.argv[1:]
+    if from_screenshots and not SCREENSHOTS_DIR.exists():
         print(f"Error: Screenshots directory not found: {SCREENSHOTS_DIR}")
         print("Generate screenshots first using screenshot_one_platform.py")
         return 1
 
-    return create_banner()
+    # Skip the rebuild when no input changed since the last run
+    manifest = Manifest()
+    key = banner_key(from_screenshots)
+    if "--force" not in sys.argv[1:] and manifest.is_current(OUTPUT_PATH, key):
+        print(f"⏭️  Banner is up to date: {OUTPUT_PATH} (use --force to rebuild)")
+        return 0
+
+    result = create_banner(from_screenshots)
+    if result == 0:
+        manifest.record(OUTPUT_PATH, key)
+        manifest.save()
+    return result
 
 
 if __name__ == "__main__":
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Compare the bundled font weights as watchface digits.
+
+Every font × size × platform variant is rasterized by rasterize_digits.py
+on a process pool, reduced to what the display actually shows (2-bit
+alpha on colour platforms, 1-bit on black & white, see
+compositor.display_alpha()) and scored with vectorized NumPy metrics
+over the whole ten-digit stack at once:
+
+- ink: mean coverage of the quadrant, so bigger and bolder digits score
+  higher
+- stroke: thinnest stroke in pixels, measured as the largest k×k square
+  whose morphological opening keeps 90% of every digit's ink
+- confusion: weighted Jaccard similarity of the most alike digit pair
+  (e.g. 3/8, 1/7) after a box blur that mimics reading at a glance
+
+Within each platform, variants are ranked by the mean of their ranks on
+the three metrics, tied values sharing their average rank (see rank_key()
+for how equal means are ordered). The table is printed and written as CSV.
+
+Usage:
+    python3 bakeoff_digits.py [--platform NAME ...] [--font NAME ...]
+                              [--scales 1.0,0.9,0.8] [--jobs N] [--report FILE]
+"""
+
+import argparse
+import csv
+import os
+import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from rasterize_digits import (
+    DIGITS,
+    OUTPUT_DIR,
+    fit_size,
+    font_path,
+    font_paths,
+    platform_box,
+    rasterize_digits,
+)
+
+# Paths
+PROJECT_DIR = Path(__file__).resolve().parent.parent.parent
+REPORT_PATH = OUTPUT_DIR / "bakeoff.csv"
+
+# Shared screenshot tooling (display depth, layout model)
+sys.path.insert(0, str(PROJECT_DIR / "tools" / "screenshots"))
+from compositor import display_alpha  # noqa: E402
+from layout import platform_layout, target_platforms  # noqa: E402
+
+# Font sizes tried, as fractions of the largest size that fits
+SCALES = (1.0, 0.9, 0.8)
+
+# Share of a digit's ink a stroke-width opening may remove
+STROKE_KEEP = 0.9
+
+# Blur radius for confusion, as a fraction of the quadrant height
+BLUR_FRACTION = 1 / 20
+
+# Scores of one digit set
+Score = namedtuple("Score", "platform font size ink stroke stroke_digit confusion pair")
+
+
+def open_square(ink, k):
+    """Morphological opening of an (n, h, w) bool stack with a k×k square."""
+    eroded = sliding_window_view(ink, k, axis=2).all(axis=-1)
+    eroded = sliding_window_view(eroded, k, axis=1).all(axis=-1)
+    padded = np.pad(eroded, ((0, 0), (k - 1, k - 1), (k - 1, k - 1)))
+    opened = sliding_window_view(padded, k, axis=2).any(axis=-1)
+    return sliding_window_view(opened, k, axis=1).any(axis=-1)
+
+
+def stroke_widths(ink):
+    """
+    Return the stroke width of each digit in an (n, h, w) bool stack.
+
+    A digit's width is the largest k for which opening with a k×k square
+    keeps STROKE_KEEP of its ink; strokes thinner than k vanish.
+    """
+    total = ink.sum(axis=(1, 2))
+    widths = np.zeros(len(ink), dtype=int)
+    alive = total > 0
+    k = 1
+    while alive.any():
+        k += 1
+        kept = open_square(ink, k).sum(axis=(1, 2))
+        failed = alive & (kept < STROKE_KEEP * total)
+        widths[failed] = k - 1
+        alive &= ~failed
+    return widths
+
+
+def box_blur(stack, radius):
+    """Box-blur an (n, h, w) float stack along both axes using cumulative sums."""
+    for axis in (1, 2):
+        padded = np.pad(stack, [(radius + 1, radius) if a == axis else (0, 0) for a in range(3)])
+        summed = np.cumsum(padded, axis=axis)
+        upper = np.take(summed, range(2 * radius + 1, summed.shape[axis]), axis=axis)
+        lower = np.take(summed, range(0, summed.shape[axis] - 2 * radius - 1), axis=axis)
+        stack = (upper - lower) / (2 * radius + 1)
+    return stack
+
+
+def confusion_matrix(shown, radius):
+    """
+    Return the (n, n) weighted Jaccard similarity of blurred digits.
+
+    1.0 means two digits look identical at a glance.
+    """
+    flat = box_blur(shown.astype(np.float32) / 255, radius).reshape(len(shown), -1)
+    low = np.minimum(flat[:, None], flat[None]).sum(axis=-1)
+    high = np.maximum(flat[:, None], flat[None]).sum(axis=-1)
+    return low / np.maximum(high, 1e-9)
+
+
+def score_variant(platform, name, scale):
+    """
+    Rasterize and score one font × size × platform digit set.
+
+    Runs in a worker process when --jobs is not 1.
+    """
+    path = font_path(name)
+    box = platform_box(platform)
+    size = max(1, round(fit_size(path, box.fit_w, box.fit_h) * scale))
+
+    stack = rasterize_digits(path, size, box)[:, :box.fit_h, :box.fit_w]
+    shown = display_alpha(stack, platform_layout(platform).is_color)
+
+    widths = stroke_widths(shown >= 128)
+    similarity = confusion_matrix(shown, max(1, round(box.fit_h * BLUR_FRACTION)))
+    np.fill_diagonal(similarity, 0)
+    first, second = np.unravel_index(np.argmax(similarity), similarity.shape)
+
+    return Score(platform, name, size,
+                 ink=float(shown.mean() / 255),
+                 stroke=int(widths.min()),
+                 stroke_digit=DIGITS[int(np.argmin(widths))],
+                 confusion=float(similarity[first, second]),
+                 pair=f"{DIGITS[min(first, second)]}/{DIGITS[max(first, second)]}")
+
+
+def average_ranks(values, best_high):
+    """
+    Rank values from 1 (best), giving tied values the mean of their ranks.
+
+    Like scipy.stats.rankdata(method="average"), so the ranks do not
+    depend on the order of the values.
+    """
+    values = np.asarray(values)
+    _, inverse, counts = np.unique(-values if best_high else values,
+                                        return_inverse=True, return_counts=True)
+    first = np.cumsum(counts) - counts + 1
+    return (first + (counts - 1) / 2)[inverse]
+
+
+def rank_key(item):
+    """
+    Sort key of a (mean rank, score) pair.
+
+    Equal mean ranks are broken by the least confusion, then the most ink,
+    the thickest stroke, and finally the font name and size, so the order
+    never depends on the order the scores came in.
+    """
+    mean, score = item
+    return (mean, score.confusion, -score.ink, -score.stroke, score.font, score.size)
+
+
+def rank(scores):
+    """
+    Order one platform's scores best first.
+
+    Returns:
+        List of (mean rank, score)
+    """
+    mean = (average_ranks([s.ink for s in scores], True)
+            + average_ranks([s.stroke for s in scores], True)
+            + average_ranks([s.confusion for s in scores], False)) / 3
+    return sorted(zip(mean.tolist(), scores), key=rank_key)
+
+
+def run_variants(variants, jobs=1):
+    """Score (platform, font, scale) variants, on a process pool when jobs > 1."""
+    if jobs == 1:
+        return [score_variant(*variant) for variant in variants]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(score_variant, *zip(*variants)))
+
+
+def write_report(ranked, report_path):
+    """Write every ranked score as CSV."""
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["platform", "rank", "mean_rank", "font", "size", "ink",
+                         "stroke", "stroke_digit", "confusion", "pair"])
+        for platform, rows in ranked.items():
+            for position, (mean, score) in enumerate(rows, 1):
+                writer.writerow([platform, position, f"{mean:.2f}", score.font, score.size,
+                                 f"{score.ink:.4f}", score.stroke, score.stroke_digit,
+                                 f"{score.confusion:.4f}", score.pair])
+
+
+def parse_scales(value):
+    """Parse a comma-separated list of size fractions."""
+    try:
+        scales = tuple(float(part) for part in value.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected numbers like 1.0,0.9, got '{value}'")
+    if not all(0 < scale <= 1 for scale in scales):
+        raise argparse.ArgumentTypeError("scales must be in (0, 1]")
+    return scales
+
+
+def main():
+    platforms = target_platforms()
+    fonts = [p.stem for p in font_paths()]
+
+    parser = argparse.ArgumentParser(description="Rank the bundled fonts as watchface digits.")
+    parser.add_argument("--platform", action="append", choices=platforms, metavar="NAME",
+                        help=f"platform to compare on (repeatable; default: {' '.join(platforms)})")
+    parser.add_argument("--font", action="append", choices=fonts, metavar="NAME",
+                        help=f"font to compare (repeatable; default: {' '.join(fonts)})")
+    parser.add_argument("--scales", type=parse_scales, default=SCALES, metavar="S,S,...",
+                        help="font sizes to try, as fractions of the largest that fits "
+                             f"(default: {','.join(map(str, SCALES))})")
+    parser.add_argument("--jobs", type=int, default=0, metavar="N",
+                        help="score variants on N processes (default: 0 = all cores)")
+    parser.add_argument("--report", type=Path, default=REPORT_PATH,
+                        help=f"CSV report path (default: {REPORT_PATH})")
+    args = parser.parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    platforms = args.platform or platforms
+
+    variants = [(platform, name, scale)
+                for platform in platforms
+                for name in args.font or fonts
+                for scale in args.scales]
+
+    print(f"Scoring {len(variants)} digit sets ({jobs} job(s))...")
+    scores = run_variants(variants, jobs)
+
+    ranked = {}
+    for platform in platforms:
+        ranked[platform] = rank([s for s in scores if s.platform == platform])
+        box = platform_box(platform)
+        print("=" * 78)
+        print(f"{platform} ({box.fit_w}×{box.fit_h})")
+        print(f"{'rank':<6}{'font':<36}{'size':>6}{'ink':>8}{'stroke':>9}{'confusion':>13}")
+        for position, (_, s) in enumerate(ranked[platform], 1):
+            print(f"{position:<6}{s.font:<36}{s.size:>6}{s.ink:>8.1%}"
+                  f"{s.stroke:>5}px {s.stroke_digit}{s.confusion:>8.2f} {s.pair}")
+
+    write_report(ranked, args.report)
+    print("=" * 78)
+    print(f"✅ Report: {args.report}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Encode digit bitmaps in the smallest format each Pebble display uses.
+
+The source digits are 8-bit gray + alpha, but the watch only shows:
+- black & white (aplite, diorite): 1 bit per pixel, alpha >= 50% is on
+- colour (basalt, chalk, emery): white at 2-bit alpha (0/85/170/255)
+
+So the resource variants are encoded at exactly that depth:
+- ~bw: 1-bit PNG
+- ~color: 2-bit palette PNG of four white entries with alpha 0/85/170/255
+
+Both go through compositor.display_alpha(), so what ships is what the
+screenshot tools render. The Pebble SDK picks the variant by file name
+tag, and with memoryFormat "Smallest" keeps it at 1 or 2 bits per pixel
+on the watch (1Bit / 2BitPalette) instead of expanding it.
+
+Usage:
+    from native_bitmap import encode_variant
+    image, params = encode_variant(alpha, is_color=True)
+    image.save("digit_sheet~color.png", **params)
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+# Paths
+PROJECT_DIR = Path(__file__).resolve().parent.parent.parent
+
+# Shared screenshot tooling (display depth)
+sys.path.insert(0, str(PROJECT_DIR / "tools" / "screenshots"))
+from compositor import display_alpha  # noqa: E402
+
+# Resource file name tag per display type, keyed by is_color
+VARIANT_TAGS = {False: "bw", True: "color"}
+
+# Palette of the colour variant: white at each 2-bit alpha level
+COLOR_ALPHAS = bytes([0, 85, 170, 255])
+
+# Bytes in a PBI (raw GBitmap) resource header: row size, flags, bounds
+PBI_HEADER_SIZE = 12
+
+
+def native_levels(alpha, is_color):
+    """Return the per-pixel palette index shown on the display (0-1 or 0-3)."""
+    return (display_alpha(alpha, is_color) // (85 if is_color else 255)).astype(np.uint8)
+
+
+def encode_variant(alpha, is_color):
+    """
+    Encode an alpha mask as a native-depth PNG image.
+
+    Returns:
+        (image, save params) to pass to Image.save
+    """
+    levels = native_levels(alpha, is_color)
+    if not is_color:
+        return Image.fromarray(levels.astype(bool)), {"optimize": True}
+
+    image = Image.fromarray(levels, "P")
+    image.putpalette([255, 255, 255] * len(COLOR_ALPHAS))
+    return image, {"bits": 2, "transparency": COLOR_ALPHAS, "optimize": True}
+
+
+def decode_levels(path):
+    """Read back the palette index of every pixel of an encoded variant."""
+    with Image.open(path) as image:
+        if image.mode == "1":
+            return np.asarray(image).astype(np.uint8)
+        return np.asarray(image.convert("RGBA"))[..., 3] // 85
+
+
+def pbi_size(width, height, bits):
+    """
+    Return the size of a raw PBI bitmap resource.
+
+    1-bit rows are padded to 32-bit words; palettized rows to whole bytes,
+    followed by a palette of 1 << bits GColor8 entries.
+    """
+    if bits == 1:
+        return PBI_HEADER_SIZE + (width + 31) // 32 * 4 * height
+    palette = (1 << bits) if bits < 8 else 0
+    return PBI_HEADER_SIZE + (width * bits + 7) // 8 * height + palette
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Pack the ten digit bitmaps into one sprite sheet resource.
+
+resources/images/digit_N.png stay the editable sources; this stacks them
+into resources/images/digit_sheet.png (one column, digit N at row
+N × 84) and writes src/digit_sheet.h with each digit's rectangle in the
+sheet. main_window_load() loads the sheet with a single
+gbitmap_create_with_resource() call and slices it with
+gbitmap_create_as_sub_bitmap(), so the watchface does one resource
+lookup and one pixel allocation instead of ten.
+
+A single column keeps every digit's rows contiguous in the sheet, and
+each sub-bitmap is the same size as the old per-digit bitmap, so
+BitmapLayer placement (and layout.py) is unchanged.
+
+The sheet is also written at each display's native depth (see
+native_bitmap.py) as digit_sheet~bw.png and digit_sheet~color.png,
+which the Pebble SDK picks per platform, and the DIGIT_SHEET entry in
+appinfo.json is kept at memoryFormat "Smallest" so they stay that small
+on the watch. --report compares the resource bytes before and after.
+
+Usage:
+    python3 pack_digit_sheet.py            # Write the sheet, variants and header
+    python3 pack_digit_sheet.py --check    # Exit 1 if any of them is out of date
+    python3 pack_digit_sheet.py --report   # Resource bytes per platform
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from native_bitmap import VARIANT_TAGS, decode_levels, encode_variant, native_levels, pbi_size
+
+# Paths
+PROJECT_DIR = Path(__file__).resolve().parent.parent.parent
+IMAGES_DIR = PROJECT_DIR / "resources" / "images"
+SHEET_PATH = IMAGES_DIR / "digit_sheet.png"
+HEADER_PATH = PROJECT_DIR / "src" / "digit_sheet.h"
+APPINFO = PROJECT_DIR / "appinfo.json"
+BUILD_DIR = PROJECT_DIR / "build"
+
+# Shared screenshot tooling (digit atlas, layout model)
+sys.path.insert(0, str(PROJECT_DIR / "tools" / "screenshots"))
+from digit_atlas import DIGIT_COUNT, DIGIT_HEIGHT, DIGIT_WIDTH, load_atlas  # noqa: E402
+from layout import DISPLAYS, target_platforms  # noqa: E402
+
+# The sheet's entry in appinfo.json resources.media
+SHEET_RESOURCE = {
+    "type": "bitmap",
+    "name": "DIGIT_SHEET",
+    "file": "images/digit_sheet.png",
+    "memoryFormat": "Smallest",
+}
+
+
+def digit_rects():
+    """Return the (x, y, w, h) rectangle of each digit in the sheet."""
+    return [(0, num * DIGIT_HEIGHT, DIGIT_WIDTH, DIGIT_HEIGHT) for num in range(DIGIT_COUNT)]
+
+
+def sheet_pixels():
+    """Stack the digit atlas into one (840, 72, 2) gray + alpha column."""
+    return np.ascontiguousarray(load_atlas()).reshape(DIGIT_COUNT * DIGIT_HEIGHT, DIGIT_WIDTH, 2)
+
+
+def variant_path(is_color):
+    """Return the tagged sheet file the SDK uses on black & white or colour platforms."""
+    return IMAGES_DIR / f"digit_sheet~{VARIANT_TAGS[is_color]}.png"
+
+
+def sheet_header():
+    """Return the C header describing the sheet layout."""
+    rects = ",\n".join(f"  {{{{{x}, {y}}}, {{{w}, {h}}}}}" for x, y, w, h in digit_rects())
+    return f"""// Generated by tools/digits/pack_digit_sheet.py - do not edit.
+#pragma once
+
+#include <pebble.h>
+
+// Size of RESOURCE_ID_DIGIT_SHEET: one column of {DIGIT_COUNT} digits
+#define DIGIT_SHEET_WIDTH {DIGIT_WIDTH}
+#define DIGIT_SHEET_HEIGHT {DIGIT_COUNT * DIGIT_HEIGHT}
+
+// Rectangle of each digit 0-9 in the sheet
+static const GRect DIGIT_SHEET_RECTS[{DIGIT_COUNT}] = {{
+{rects}
+}};
+"""
+
+
+def sheet_is_current():
+    """Whether the sheet PNG holds exactly the current digit pixels."""
+    try:
+        with Image.open(SHEET_PATH) as sheet:
+            return np.array_equal(np.asarray(sheet.convert("LA")), sheet_pixels())
+    except OSError:
+        return False
+
+
+def variant_is_current(is_color):
+    """Whether a native variant shows exactly the current digits."""
+    try:
+        levels = decode_levels(variant_path(is_color))
+    except OSError:
+        return False
+    return np.array_equal(levels, native_levels(sheet_pixels()[..., 1], is_color))
+
+
+def header_is_current():
+    """Whether the header matches the current sheet layout."""
+    return HEADER_PATH.exists() and HEADER_PATH.read_text() == sheet_header()
+
+
+def write_sheet():
+    Image.fromarray(sheet_pixels(), "LA").save(SHEET_PATH, optimize=True)
+
+
+def write_variant(is_color):
+    image, params = encode_variant(sheet_pixels()[..., 1], is_color)
+    image.save(variant_path(is_color), **params)
+
+
+def write_header():
+    HEADER_PATH.write_text(sheet_header())
+
+
+def update_appinfo():
+    """
+    Point the DIGIT_SHEET resource at the sheet with memoryFormat "Smallest".
+
+    Other resources and keys are left untouched.
+
+    Returns:
+        True if appinfo.json was changed
+    """
+    text = APPINFO.read_text()
+    appinfo = json.loads(text)
+    media = appinfo.setdefault("resources", {}).setdefault("media", [])
+    for index, entry in enumerate(media):
+        if entry.get("name") == SHEET_RESOURCE["name"]:
+            media[index] = {**entry, **SHEET_RESOURCE}
+            break
+    else:
+        media.append(dict(SHEET_RESOURCE))
+
+    updated = json.dumps(appinfo, indent=2) + "\n"
+    if updated == text:
+        return False
+    APPINFO.write_text(updated)
+    return True
+
+
+def print_report():
+    """
+    Print the digit sheet's resource bytes per platform, before and after.
+
+    Before is the 8-bit gray + alpha sheet the SDK would otherwise convert;
+    after is the native variant, both as stored (PNG) and as a raw PBI at
+    the variant's bit depth. Sizes of app_resources.pbpack from a previous
+    `pebble build` are shown when present.
+    """
+    sheet_bytes = SHEET_PATH.stat().st_size
+    height = DIGIT_COUNT * DIGIT_HEIGHT
+
+    print(f"{'platform':<10}{'variant':>9}{'before PNG':>12}{'after PNG':>11}"
+          f"{'8-bit PBI':>11}{'native PBI':>12}{'pbpack':>9}")
+    for platform in target_platforms():
+        is_color = DISPLAYS[platform][3]
+        bits = 2 if is_color else 1
+        pbpack = BUILD_DIR / platform / "app_resources.pbpack"
+        measured = f"{pbpack.stat().st_size:,}" if pbpack.exists() else "-"
+        print(f"{platform:<10}{'~' + VARIANT_TAGS[is_color]:>9}{sheet_bytes:>12,}"
+              f"{variant_path(is_color).stat().st_size:>11,}"
+              f"{pbi_size(DIGIT_WIDTH, height, 8):>11,}"
+              f"{pbi_size(DIGIT_WIDTH, height, bits):>12,}{measured:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack the digit bitmaps into one sprite sheet.")
+    parser.add_argument("--check", action="store_true",
+                        help="only check that the sheet, variants and header match the digit PNGs")
+    parser.add_argument("--report", action="store_true",
+                        help="print resource bytes per platform, before and after")
+    args = parser.parse_args()
+
+    if args.report:
+        print_report()
+        return 0
+
+    # PNG bytes vary with the zlib build, so images are compared by pixels
+    outputs = [(SHEET_PATH, sheet_is_current, write_sheet)]
+    for is_color in VARIANT_TAGS:
+        outputs.append((variant_path(is_color),
+                        lambda c=is_color: variant_is_current(c),
+                        lambda c=is_color: write_variant(c)))
+    outputs.append((HEADER_PATH, header_is_current, write_header))
+
+    if args.check:
+        stale = [path for path, is_current, _ in outputs if not is_current()]
+        for path in stale:
+            print(f"❌ Out of date: {path.relative_to(PROJECT_DIR)}")
+        if stale:
+            print("   Run: python3 tools/digits/pack_digit_sheet.py")
+            return 1
+        print("✅ Digit sheet is up to date")
+        return 0
+
+    for path, is_current, write in outputs:
+        if is_current():
+            print(f"⏭️  {path.relative_to(PROJECT_DIR)} unchanged")
+            continue
+        write()
+        print(f"✅ Wrote {path.relative_to(PROJECT_DIR)} ({path.stat().st_size:,} bytes)")
+
+    if update_appinfo():
+        print(f"✅ Updated {APPINFO.relative_to(PROJECT_DIR)} ({SHEET_RESOURCE['name']})")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
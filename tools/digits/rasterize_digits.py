@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Rasterize the digit bitmaps from the bundled Atkinson Hyperlegible fonts.
+
+For every platform and every resources/fonts/*.ttf weight, the ten
+digits are rendered at the largest font size whose ink fits the
+platform's quadrant (the smallest BitmapLayer frame from layout.py),
+all at the same size so stroke weight and height match across digits.
+The digits share one baseline, with their combined height centred
+vertically; each digit is centred horizontally on its own ink.
+
+The size is found by bisection over integer font sizes on the digits'
+tight ink boxes. Glyph masks and ink extents are memoized per (font,
+size), and solved sizes per (font, quadrant size), so a full search over
+every platform and weight probes only a few dozen sizes and the final
+render never rasterizes a glyph twice.
+
+Output matches resources/images/digit_N.png: gray + alpha PNGs, white
+where the glyph has any coverage and the coverage in alpha, sized to
+the largest layer frame so no visible row is clipped.
+
+Usage:
+    python3 rasterize_digits.py [--platform NAME ...] [--font NAME ...]
+                                [--output DIR] [--sizes]
+
+Examples:
+    python3 rasterize_digits.py                     # All platforms × weights
+    python3 rasterize_digits.py --platform emery --font AtkinsonHyperlegible-Bold
+    python3 rasterize_digits.py --sizes             # Only print solved sizes
+"""
+
+import argparse
+import sys
+import time
+from collections import namedtuple
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+# Paths
+PROJECT_DIR = Path(__file__).resolve().parent.parent.parent
+FONTS_DIR = PROJECT_DIR / "resources" / "fonts"
+OUTPUT_DIR = PROJECT_DIR / "build" / "digits"
+
+# Shared screenshot tooling (layout model)
+sys.path.insert(0, str(PROJECT_DIR / "tools" / "screenshots"))
+from layout import platform_layout, target_platforms  # noqa: E402
+
+DIGITS = "0123456789"
+
+# Font size the bisection bracket is estimated from
+REFERENCE_SIZE = 200
+
+# A rasterized glyph: coverage mask trimmed to its ink, and the ink box
+# (left, top, right, bottom) relative to the pen position on the baseline
+Glyph = namedtuple("Glyph", "mask box")
+
+# Where digits are placed on a platform: ink must fit in fit_w×fit_h, the
+# bitmap itself is canvas_w×canvas_h
+Box = namedtuple("Box", "fit_w fit_h canvas_w canvas_h")
+
+
+def font_paths():
+    """Return the bundled TrueType fonts, sorted by name."""
+    return sorted(FONTS_DIR.glob("*.ttf"))
+
+
+def font_path(name):
+    """Return the path of a bundled font by file stem."""
+    path = FONTS_DIR / f"{name}.ttf"
+    if not path.exists():
+        valid = ", ".join(p.stem for p in font_paths())
+        raise FileNotFoundError(f"Font not found: {path} (valid: {valid})")
+    return path
+
+
+@lru_cache(maxsize=None)
+def load_font(path, size):
+    """Load a font once per (path, size)."""
+    return ImageFont.truetype(str(path), size)
+
+
+@lru_cache(maxsize=None)
+def glyph(path, size, char):
+    """
+    Rasterize one character, cached per (font, size, character).
+
+    Returns:
+        Glyph with a read-only uint8 coverage mask trimmed to the ink
+
+    Raises:
+        ValueError: If the character leaves no ink at this size (e.g. the
+            font has no glyph for it)
+    """
+    font = load_font(path, size)
+    left, top, right, bottom = font.getbbox(char, anchor="ls")
+    image = Image.new("L", (right - left, bottom - top))
+    ImageDraw.Draw(image).text((-left, -top), char, font=font, fill=255, anchor="ls")
+
+    mask = np.asarray(image)
+    rows = np.flatnonzero(mask.any(axis=1))
+    cols = np.flatnonzero(mask.any(axis=0))
+    if rows.size == 0 or cols.size == 0:
+        raise ValueError(f"{Path(path).stem} has no ink for '{char}' at size {size}")
+    mask = mask[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1].copy()
+    mask.flags.writeable = False
+    box = (left + int(cols[0]), top + int(rows[0]),
+           left + int(cols[-1]) + 1, top + int(rows[0]) + mask.shape[0])
+    return Glyph(mask, box)
+
+
+@lru_cache(maxsize=None)
+def digit_extent(path, size):
+    """
+    Return (widest digit ink, top, bottom) of the ten digits at a size,
+    with top and bottom relative to the baseline.
+
+    Each call that misses the cache is one size probe of the solver.
+    """
+    boxes = [glyph(path, size, char).box for char in DIGITS]
+    width = max(right - left for left, _, right, _ in boxes)
+    return width, min(box[1] for box in boxes), max(box[3] for box in boxes)
+
+
+def fits(path, size, width, height):
+    """Whether every digit's ink fits a width×height box at this size."""
+    ink_width, top, bottom = digit_extent(path, size)
+    return ink_width <= width and bottom - top <= height
+
+
+@lru_cache(maxsize=None)
+def fit_size(path, width, height):
+    """
+    Bisect for the largest integer font size whose digits fit width×height.
+
+    The search keeps lo fitting and hi not fitting. Glyphs scale almost
+    linearly, so the bracket starts around an estimate from the
+    REFERENCE_SIZE metrics and is only widened (doubling its span) if
+    hinting pushes the answer outside it.
+
+    Raises:
+        ValueError: If the digits do not fit even at size 1
+    """
+    ink_width, top, bottom = digit_extent(path, REFERENCE_SIZE)
+    estimate = int(REFERENCE_SIZE * min(width / ink_width, height / (bottom - top)))
+    lo, hi = max(1, estimate - 1), estimate + 2
+
+    while not fits(path, lo, width, height):
+        if lo == 1:
+            raise ValueError(f"{path.stem} digits do not fit {width}×{height}")
+        lo, hi = max(1, 2 * lo - hi), lo
+    while fits(path, hi, width, height):
+        lo, hi = hi, 2 * hi - lo
+
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if fits(path, mid, width, height):
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+
+def platform_box(platform):
+    """
+    Return the digit box of a platform.
+
+    Ink has to fit the smallest layer frame, since one bitmap is shared by
+    all four quadrants; the bitmap is as large as the largest frame.
+    """
+    frames = platform_layout(platform).frames
+    return Box(min(f.w for f in frames), min(f.h for f in frames),
+               max(f.w for f in frames), max(f.h for f in frames))
+
+
+def rasterize_digits(path, size, box):
+    """
+    Render the ten digits of a font into bitmaps of the box's canvas size.
+
+    Returns:
+        (10, canvas_h, canvas_w) uint8 coverage stack
+    """
+    _, top, bottom = digit_extent(path, size)
+    baseline = (box.fit_h - (bottom - top)) // 2 - top
+
+    stack = np.zeros((len(DIGITS), box.canvas_h, box.canvas_w), dtype=np.uint8)
+    for num, char in enumerate(DIGITS):
+        mask, (left, glyph_top, right, _) = glyph(path, size, char)
+        x = (box.fit_w - (right - left)) // 2
+        y = baseline + glyph_top
+        stack[num, y:y + mask.shape[0], x:x + mask.shape[1]] = mask
+    return stack
+
+
+def save_digits(stack, output_dir):
+    """Write a coverage stack as digit_N.png gray + alpha bitmaps."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for num, alpha in enumerate(stack):
+        gray = np.where(alpha > 0, 255, 0).astype(np.uint8)
+        Image.fromarray(np.dstack([gray, alpha]), "LA").save(output_dir / f"digit_{num}.png")
+
+
+def print_sizes(platforms, fonts):
+    """Print the solved size of every font for each distinct layer frame size."""
+    for platform in platforms:
+        frames = sorted({(f.w, f.h) for f in platform_layout(platform).frames})
+        box = platform_box(platform)
+        print(f"{platform}:")
+        for name in fonts:
+            path = font_path(name)
+            sizes = "  ".join(f"{w}×{h}: {fit_size(path, w, h)}px" for w, h in frames)
+            print(f"  {name:<36}{sizes}  → {fit_size(path, box.fit_w, box.fit_h)}px")
+
+
+def main():
+    platforms = target_platforms()
+    fonts = [p.stem for p in font_paths()]
+
+    parser = argparse.ArgumentParser(description="Rasterize digit bitmaps from the bundled fonts.")
+    parser.add_argument("--platform", action="append", choices=platforms, metavar="NAME",
+                        help=f"platform to rasterize for (repeatable; default: {' '.join(platforms)})")
+    parser.add_argument("--font", action="append", choices=fonts, metavar="NAME",
+                        help=f"font to rasterize (repeatable; default: {' '.join(fonts)})")
+    parser.add_argument("--output", type=Path, default=OUTPUT_DIR,
+                        help=f"output directory (default: {OUTPUT_DIR})")
+    parser.add_argument("--sizes", action="store_true",
+                        help="only print the solved font sizes, without writing bitmaps")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.sizes:
+        print_sizes(args.platform or platforms, args.font or fonts)
+        print(f"\n{digit_extent.cache_info().misses} sizes probed "
+              f"({glyph.cache_info().misses} glyph rasterizations) "
+              f"in {time.perf_counter() - start:.2f}s")
+        return 0
+
+    print("Rasterizing digits from resources/fonts...")
+    print("=" * 50)
+    for platform in args.platform or platforms:
+        box = platform_box(platform)
+        for name in args.font or fonts:
+            path = font_path(name)
+            size = fit_size(path, box.fit_w, box.fit_h)
+            save_digits(rasterize_digits(path, size, box), args.output / platform / name)
+            print(f"✅ {platform} {name}: {size}px in {box.fit_w}×{box.fit_h} "
+                  f"({box.canvas_w}×{box.canvas_h} bitmaps)")
+
+    print("=" * 50)
+    print(f"   {digit_extent.cache_info().misses} font sizes probed")
+    print(f"✅ Complete in {time.perf_counter() - start:.2f}s! Digits in: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
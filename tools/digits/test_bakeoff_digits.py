@@ -0,0 +1,51 @@
+"""
+Tests for the ranking in bakeoff_digits.py.
+
+Usage:
+    python3 -m pytest tools/digits/test_bakeoff_digits.py
+"""
+
+import random
+
+import numpy as np
+
+from bakeoff_digits import Score, average_ranks, rank
+
+
+def score(font, size, ink, stroke, confusion):
+    return Score("aplite", font, size, ink, stroke, "1", confusion, "3/8")
+
+
+# Small integer stroke widths tie often, as in the real bake-off
+SCORES = [
+    score("Bold", 122, 0.31, 9, 0.80),
+    score("MonoExtraBold", 122, 0.32, 9, 0.81),
+    score("ExtraBold", 122, 0.31, 10, 0.82),
+    score("Mono", 110, 0.25, 7, 0.78),
+    score("MonoBold", 110, 0.28, 9, 0.80),
+    score("Regular", 110, 0.25, 7, 0.78),
+    score("Medium", 99, 0.22, 7, 0.76),
+]
+
+
+def test_ties_share_average_rank():
+    assert average_ranks([3, 1, 3, 2], best_high=True).tolist() == [1.5, 4.0, 1.5, 3.0]
+    assert average_ranks([0.5, 0.5, 0.2], best_high=False).tolist() == [2.5, 2.5, 1.0]
+
+
+def test_ranking_ignores_input_order():
+    expected = [(mean, s.font, s.size) for mean, s in rank(SCORES)]
+    shuffled = list(SCORES)
+    rng = random.Random(0)
+    for _ in range(20):
+        rng.shuffle(shuffled)
+        assert [(mean, s.font, s.size) for mean, s in rank(shuffled)] == expected
+    assert [(mean, s.font, s.size) for mean, s in rank(SCORES[::-1])] == expected
+
+
+def test_equal_means_break_on_documented_key():
+    # Identical metrics, so only the font name can order them
+    tied = [score("B", 100, 0.3, 8, 0.5), score("A", 100, 0.3, 8, 0.5)]
+    means, fonts = zip(*[(mean, s.font) for mean, s in rank(tied)])
+    assert np.allclose(means, 1.5)
+    assert fonts == ("A", "B")
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Export an animated preview of the watchface over a range of minutes.
+
+Frames come from the programmatic compositor and are streamed one at a
+time into the encoder, so peak memory stays at a few frames even for a
+full day (1440 minutes). Each frame after the first only stores the
+rectangle that changed since the previous one.
+
+Pillow's multi-frame writers collect every frame before encoding, so
+this uses small streaming container writers instead:
+- APNG: written chunk by chunk with zlib
+- WebP: each frame is encoded losslessly by Pillow and muxed into ANMF
+  chunks
+- GIF: each frame is encoded by Pillow as a still GIF, whose image data
+  and colour table are muxed into the animation
+
+Usage:
+    python3 animate_preview.py [--platform NAME ...] [--format apng|webp|gif]
+                               [--from HH:MM] [--to HH:MM] [--24h] [--fps N]
+                               [--output DIR]
+
+Examples:
+    python3 animate_preview.py --platform chalk
+    python3 animate_preview.py --format webp --from 09:00 --to 10:00 --24h
+"""
+
+import argparse
+import io
+import struct
+import zlib
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from compositor import render_frames
+from layout import platform_layout, target_platforms
+
+# Paths
+PROJECT_DIR = Path(__file__).resolve().parent.parent.parent
+PREVIEW_DIR = PROJECT_DIR / "build" / "previews"
+
+# Frames rendered per compositor call while streaming
+STREAM_BATCH = 8
+
+FORMATS = {"apng": ".png", "webp": ".webp", "gif": ".gif"}
+
+
+def parse_time(value):
+    """Parse 'HH:MM' into (hour, minute)."""
+    try:
+        hour, minute = (int(part) for part in value.split(":"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected HH:MM, got '{value}'")
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        raise argparse.ArgumentTypeError(f"time out of range: '{value}'")
+    return hour, minute
+
+
+def minute_range(start, end, is_24h):
+    """Return (hour, minute, is_24h, name) entries from start to end inclusive."""
+    first = start[0] * 60 + start[1]
+    last = end[0] * 60 + end[1]
+    if last < first:
+        last += 24 * 60  # Wrap past midnight
+    suffix = "24h" if is_24h else "12h"
+    times = []
+    for total in range(first, last + 1):
+        hour, minute = divmod(total % (24 * 60), 60)
+        times.append((hour, minute, is_24h, f"{hour:02d}-{minute:02d}-{suffix}"))
+    return times
+
+
+def stream_frames(times, platform, batch=STREAM_BATCH):
+    """Yield rendered frames one by one, reusing a batch-sized buffer."""
+    buffer = None
+    for start in range(0, len(times), batch):
+        chunk = times[start:start + batch]
+        buffer = render_frames(chunk, platform, out=buffer)
+        yield from buffer[:len(chunk)]
+
+
+def changed_box(previous, frame, align=1):
+    """
+    Return the (left, top, right, bottom) box that differs between frames.
+
+    The whole frame is returned for the first frame, and a 1×1 box when
+    nothing changed. left/top are rounded down to a multiple of align.
+    """
+    height, width = frame.shape
+    if previous is None:
+        return (0, 0, width, height)
+
+    diff = previous != frame
+    rows = np.flatnonzero(diff.any(axis=1))
+    if rows.size == 0:
+        return (0, 0, 1, 1)
+    cols = np.flatnonzero(diff.any(axis=0))
+    left = cols[0] // align * align
+    top = rows[0] // align * align
+    return (int(left), int(top), int(cols[-1]) + 1, int(rows[-1]) + 1)
+
+
+def png_chunk(tag, data):
+    """Encode one PNG chunk."""
+    return (struct.pack(">I", len(data)) + tag + data
+            + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF))
+
+
+class ApngWriter:
+    """Streaming APNG writer for 8-bit grayscale frames."""
+
+    def __init__(self, fp, width, height, frame_count, duration_ms):
+        self.fp = fp
+        self.duration_ms = duration_ms
+        self.sequence = 0
+        self.previous = None
+        fp.write(b"\x89PNG\r\n\x1a\n")
+        fp.write(png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 0, 0, 0, 0)))
+        fp.write(png_chunk(b"acTL", struct.pack(">II", frame_count, 0)))
+
+    def add_frame(self, frame):
+        left, top, right, bottom = changed_box(self.previous, frame)
+        region = frame[top:bottom, left:right]
+
+        # Filter type 0 (None) in front of every scanline
+        raw = np.zeros((region.shape[0], region.shape[1] + 1), dtype=np.uint8)
+        raw[:, 1:] = region
+        data = zlib.compress(raw.tobytes(), 9)
+
+        self.fp.write(png_chunk(b"fcTL", struct.pack(
+            ">IIIIIHHBB", self.sequence, right - left, bottom - top, left, top,
+            self.duration_ms, 1000, 0, 0)))
+        self.sequence += 1
+        if self.previous is None:
+            self.fp.write(png_chunk(b"IDAT", data))
+        else:
+            self.fp.write(png_chunk(b"fdAT", struct.pack(">I", self.sequence) + data))
+            self.sequence += 1
+        self.previous = frame.copy()
+
+    def close(self):
+        self.fp.write(png_chunk(b"IEND", b""))
+
+
+def riff_chunk(tag, data):
+    """Encode one RIFF chunk, padded to an even length."""
+    return tag + struct.pack("<I", len(data)) + data + (b"\0" if len(data) % 2 else b"")
+
+
+def uint24(value):
+    return struct.pack("<I", value)[:3]
+
+
+class WebpWriter:
+    """Streaming animated WebP writer (lossless frames)."""
+
+    def __init__(self, fp, width, height, frame_count, duration_ms):
+        self.fp = fp
+        self.duration_ms = duration_ms
+        self.previous = None
+        self.start = fp.tell()
+        fp.write(b"RIFF\0\0\0\0WEBP")  # Size is patched in close()
+        fp.write(riff_chunk(b"VP8X", bytes([0x02, 0, 0, 0]) + uint24(width - 1) + uint24(height - 1)))
+        fp.write(riff_chunk(b"ANIM", bytes([0, 0, 0, 255]) + struct.pack("<H", 0)))
+
+    def add_frame(self, frame):
+        # ANMF frame offsets are stored halved, so they must be even
+        left, top, right, bottom = changed_box(self.previous, frame, align=2)
+        region = frame[top:bottom, left:right]
+
+        buf = io.BytesIO()
+        Image.fromarray(np.ascontiguousarray(region), "L").save(buf, "WEBP", lossless=True)
+        encoded = buf.getvalue()
+
+        # Keep the bitstream chunks (VP8L, or ALPH + VP8) of the still image
+        frame_data = b""
+        offset = 12
+        while offset < len(encoded):
+            tag = encoded[offset:offset + 4]
+            size = struct.unpack("<I", encoded[offset + 4:offset + 8])[0]
+            chunk_end = offset + 8 + size + (size % 2)
+            if tag in (b"VP8L", b"VP8 ", b"ALPH"):
+                frame_data += encoded[offset:chunk_end]
+            offset = chunk_end
+
+        header = (uint24(left // 2) + uint24(top // 2)
+                  + uint24(right - left - 1) + uint24(bottom - top - 1)
+                  + uint24(self.duration_ms) + bytes([0x02]))  # No blending, no disposal
+        self.fp.write(riff_chunk(b"ANMF", header + frame_data))
+        self.previous = frame.copy()
+
+    def close(self):
+        end = self.fp.tell()
+        self.fp.seek(self.start + 4)
+        self.fp.write(struct.pack("<I", end - self.start - 8))
+        self.fp.seek(end)
+
+
+def gif_blocks(data, offset):
+    """Return the end offset of the GIF data sub-blocks starting at offset."""
+    while data[offset]:
+        offset += data[offset] + 1
+    return offset + 1
+
+
+def gif_color_table(packed):
+    """Return the size in bytes of the colour table a GIF packed field describes."""
+    return 3 << ((packed & 0x07) + 1) if packed & 0x80 else 0
+
+
+class GifWriter:
+    """Streaming looping GIF writer for 8-bit grayscale frames."""
+
+    def __init__(self, fp, width, height, frame_count, duration_ms):
+        self.fp = fp
+        self.delay = max(2, round(duration_ms / 10))  # Centiseconds; most viewers clamp shorter delays
+        self.previous = None
+        # No global colour table: every frame carries Pillow's palette for it
+        fp.write(b"GIF89a" + struct.pack("<HHBBB", width, height, 0, 0, 0))
+        fp.write(b"\x21\xff\x0bNETSCAPE2.0\x03\x01" + struct.pack("<H", 0) + b"\x00")  # Loop forever
+
+    def add_frame(self, frame):
+        left, top, right, bottom = changed_box(self.previous, frame)
+        region = frame[top:bottom, left:right]
+
+        buf = io.BytesIO()
+        Image.fromarray(np.ascontiguousarray(region), "L").save(buf, "GIF")
+        encoded = buf.getvalue()
+
+        # Keep the still's colour table (global or local) as this frame's
+        # local one, and its LZW image data
+        offset = 13 + gif_color_table(encoded[10])
+        table_packed, table = encoded[10], encoded[13:offset]
+        while encoded[offset] == 0x21:  # Skip extensions
+            offset = gif_blocks(encoded, offset + 2)
+        descriptor_packed = encoded[offset + 9]
+        offset += 10
+        if descriptor_packed & 0x80:
+            table_packed = descriptor_packed
+            table = encoded[offset:offset + gif_color_table(descriptor_packed)]
+            offset += len(table)
+        image_data = encoded[offset:gif_blocks(encoded, offset + 1)]
+
+        self.fp.write(b"\x21\xf9\x04" + struct.pack("<BHB", 1 << 2, self.delay, 0) + b"\x00")  # Do not dispose
+        self.fp.write(b"\x2c" + struct.pack("<HHHHB", left, top, right - left, bottom - top,
+                                            0x80 | (descriptor_packed & 0x40) | (table_packed & 0x07)))
+        self.fp.write(table + image_data)
+        self.previous = frame.copy()
+
+    def close(self):
+        self.fp.write(b"\x3b")
+
+
+WRITERS = {"apng": ApngWriter, "webp": WebpWriter, "gif": GifWriter}
+
+
+def export_preview(platform, times, output_path, fmt="apng", fps=30):
+    """
+    Stream an animated preview of times on a platform into output_path.
+
+    Returns:
+        Size of the written file in bytes
+    """
+    layout = platform_layout(platform)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+
+    with open(tmp_path, "wb") as fp:
+        writer = WRITERS[fmt](fp, layout.width, layout.height, len(times), round(1000 / fps))
+        for frame in stream_frames(times, platform):
+            writer.add_frame(frame)
+        writer.close()
+
+    tmp_path.replace(output_path)
+    return output_path.stat().st_size
+
+
+def main():
+    platforms = target_platforms()
+
+    parser = argparse.ArgumentParser(description="Export an animated day preview.")
+    parser.add_argument("--platform", action="append", choices=platforms, metavar="NAME",
+                        help=f"platform to export (repeatable; default: {' '.join(platforms)})")
+    parser.add_argument("--format", choices=FORMATS, default="apng",
+                        help="animation format (default: apng)")
+    parser.add_argument("--from", dest="start", type=parse_time, default=(0, 0), metavar="HH:MM",
+                        help="first minute (default: 00:00)")
+    parser.add_argument("--to", dest="end", type=parse_time, default=(23, 59), metavar="HH:MM",
+                        help="last minute, inclusive (default: 23:59)")
+    parser.add_argument("--24h", dest="is_24h", action="store_true",
+                        help="use 24h format instead of 12h")
+    parser.add_argument("--fps", type=int, default=30,
+                        help="playback speed in minutes per second (default: 30)")
+    parser.add_argument("--output", type=Path, default=PREVIEW_DIR,
+                        help=f"output directory (default: {PREVIEW_DIR})")
+    args = parser.parse_args()
+    if args.fps < 1:
+        parser.error("--fps must be at least 1")
+
+    times = minute_range(args.start, args.end, args.is_24h)
+    suffix = "24h" if args.is_24h else "12h"
+    span = f"{times[0][3][:5]}_{times[-1][3][:5]}-{suffix}"
+
+    print(f"Exporting {len(times)}-frame {args.format.upper()} previews ({span})...")
+    print("=" * 50)
+    for platform in args.platform or platforms:
+        output_path = args.output / f"{platform}-{span}{FORMATS[args.format]}"
+        size = export_preview(platform, times, output_path, args.format, args.fps)
+        print(f"✅ {platform}: {output_path.name} ({size / 1024:.0f} KB)")
+
+    print("=" * 50)
+    print(f"✅ Complete! Previews in: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
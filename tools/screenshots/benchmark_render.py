@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark frame compositing over the full minute range.
+
+Compares, per platform, over all 2880 frames of a day (12h and 24h):
+
+- before: the original per-call path, with Image.new per frame, each
+  digit opened and decoded from disk, and Image.paste into the quadrant
+- after: render_frames(), assembling frames by block copies of the
+  pre-rendered quadrant tiles
+
+Only compositing is timed; PNG encoding is excluded.
+
+Usage:
+    python3 benchmark_render.py [platform ...]
+"""
+
+import sys
+import time
+
+from PIL import Image
+
+from compositor import BLANK, display_digits, quadrant_tiles, render_frames
+from digit_atlas import digit_path
+from generate_screenshots_programmatic import day_times
+from layout import platform_layout, target_platforms
+
+
+def render_per_call(times, platform):
+    """Composite each frame separately, the way generate_screenshot() used to."""
+    layout = platform_layout(platform)
+    for hour, minute, is_24h, _ in times:
+        screenshot = Image.new('RGB', (layout.width, layout.height), (0, 0, 0))
+        for quad, num in zip(layout.quadrants, display_digits(hour, minute, is_24h)):
+            if num == BLANK:
+                continue
+            with Image.open(digit_path(num)) as digit:
+                screenshot.paste(digit.crop((0, 0, quad.w, quad.h)), (quad.x, quad.y))
+
+
+def frames_per_second(render, times, platform):
+    """Time one call of render(times, platform) and return frames per second."""
+    start = time.perf_counter()
+    render(times, platform)
+    return len(times) / (time.perf_counter() - start)
+
+
+def main():
+    platforms = sys.argv[1:] or target_platforms()
+    times = day_times(is_24h=False) + day_times(is_24h=True)
+
+    print(f"Compositing {len(times)} frames per platform (full minute range, 12h + 24h)")
+    print("=" * 60)
+    print(f"{'platform':<10}{'before (fps)':>16}{'after (fps)':>16}{'speedup':>12}")
+
+    for platform in platforms:
+        # Build the tile cache outside the timed region, as a long run would
+        quadrant_tiles(platform)
+
+        before = frames_per_second(render_per_call, times, platform)
+        after = frames_per_second(render_frames, times, platform)
+        print(f"{platform:<10}{before:>16,.0f}{after:>16,.0f}{after / before:>11.0f}×")
+
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Capture real emulator screenshots from a single screenshot-mode build.
+
+The watchface is built once with SCREENSHOT_MODE=1 (see wscript), which
+makes it take the displayed time from an AppMessage instead of the
+clock, and BUILD_PLATFORMS set to the platforms being captured, so no
+other platform is compiled. For each platform the driver installs it on
+one emulator, then steps through the times by sending each one and
+grabbing the framebuffer over the same connection, so 25 screenshots
+need one build and five installs instead of 25 builds.
+
+There are no fixed sleeps: after the install and after each time, the
+framebuffer is polled until STABLE_FRAMES grabs in a row hash the same
+(see EmulatorSession.wait_for_frame()), so a capture takes as long as
+the redraw and no longer.
+
+Screenshots come straight from the framebuffer at display size, named
+<platform>/HH-MM-12h.png like the programmatic ones, and each is
+compared with the compositor's render (see diff_screenshots.py).
+
+Run it inside the Pebble SDK environment: it calls the `pebble` tool and
+talks to the emulator with pebble_tool / libpebble2.
+
+Usage:
+    python3 capture_emulator.py [--platform NAME ...] [--time HH-MM-12h ...]
+                                [--output DIR] [--no-build]
+
+Examples:
+    python3 capture_emulator.py                           # Store times, all platforms
+    python3 capture_emulator.py --platform chalk --time 09-41-12h
+    nix-shell --run "python3 tools/screenshots/capture_emulator.py"
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import threading
+import time
+import uuid
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from compositor import parse_time_name
+from diff_screenshots import compare
+from generate_screenshots_programmatic import TIMES
+from layout import APPINFO, target_platforms
+
+# Paths
+PROJECT_DIR = Path(__file__).resolve().parent.parent.parent
+OUTPUT_DIR = PROJECT_DIR / "build" / "captures"
+
+# Seconds to wait for the watch to acknowledge a time
+ACK_TIMEOUT = 10
+
+# The watchface counts as drawn once this many framebuffer grabs in a
+# row are identical
+STABLE_FRAMES = 3
+
+# Seconds between framebuffer grabs, and the most to wait for a stable frame
+POLL_SECONDS = 0.05
+READY_TIMEOUT = 15
+
+# One saved screenshot: mismatched pixels against the compositor (None if
+# it could not be compared) and seconds until the frame was ready
+Capture = namedtuple("Capture", "path mismatched waited")
+
+
+def sdk_missing():
+    """Return the name of the first missing Pebble SDK module, or None."""
+    try:
+        import libpebble2  # noqa: F401
+        import pebble_tool  # noqa: F401
+    except ImportError as e:
+        return e.name
+    return None
+
+
+def pebble(*args, env=None):
+    """Run a pebble tool command in the project, raising on failure."""
+    try:
+        result = subprocess.run(["pebble", *args], cwd=PROJECT_DIR, env=env,
+                                capture_output=True, text=True)
+    except FileNotFoundError:
+        raise RuntimeError("pebble tool not found: run inside the Pebble SDK environment")
+    if result.returncode != 0:
+        raise RuntimeError(f"pebble {' '.join(args)} failed:\n{result.stderr.strip()}")
+
+
+def build_screenshot_mode(platforms):
+    """
+    Build once with SCREENSHOT_MODE defined.
+
+    BUILD_PLATFORMS restricts wscript to the platforms being captured, so
+    the others are neither compiled nor bundled.
+    """
+    pebble("build", env={**os.environ, "SCREENSHOT_MODE": "1",
+                         "BUILD_PLATFORMS": ",".join(platforms)})
+
+
+def app_keys():
+    """Return the app UUID and the screenshot AppMessage keys from appinfo.json."""
+    with open(APPINFO) as f:
+        appinfo = json.load(f)
+    keys = appinfo["appKeys"]
+    return uuid.UUID(appinfo["uuid"]), (keys["SCREENSHOT_HOUR"], keys["SCREENSHOT_MINUTE"],
+                                        keys["SCREENSHOT_24H"])
+
+
+class PendingSends:
+    """
+    Outcome of each AppMessage sent, by transaction ID.
+
+    libpebble2's AppMessageService broadcasts "ack" and "nack" events as
+    handler(transaction_id, uuid) on its event thread; on_ack and on_nack
+    are registered for them, and wait() blocks the sender until either
+    arrives. A reply can come back before wait() is called, so both sides
+    share one Event per transaction.
+    """
+
+    def __init__(self):
+        self.events = {}
+        self.nacked = set()
+        self.lock = threading.Lock()
+
+    def event(self, txid):
+        with self.lock:
+            return self.events.setdefault(txid, threading.Event())
+
+    def on_ack(self, txid, _uuid):
+        self.event(txid).set()
+
+    def on_nack(self, txid, _uuid):
+        with self.lock:
+            self.nacked.add(txid)
+        self.event(txid).set()
+
+    def wait(self, txid, timeout):
+        """
+        Wait for a transaction's reply.
+
+        Raises:
+            RuntimeError: If the watch rejected the message
+            TimeoutError: If neither reply came within timeout
+        """
+        if not self.event(txid).wait(timeout):
+            raise TimeoutError(f"no reply to AppMessage {txid} after {timeout}s")
+        with self.lock:
+            if txid in self.nacked:
+                raise RuntimeError(f"AppMessage {txid} was rejected (nack)")
+
+
+class EmulatorSession:
+    """
+    A connection to one platform's emulator running the screenshot build.
+
+    Connects over transport when given (a libpebble2 transport), else to
+    the emulator pebble_tool has recorded for the platform.
+    """
+
+    def __init__(self, platform, transport=None):
+        # Only available inside the Pebble SDK environment
+        from libpebble2.communication import PebbleConnection
+        from libpebble2.services.appmessage import AppMessageService
+        from pebble_tool.sdk.emulator import ManagedEmulatorTransport
+
+        self.platform = platform
+        self.app_uuid, self.keys = app_keys()
+        self.connection = PebbleConnection(transport or ManagedEmulatorTransport(platform))
+        self.connection.connect()
+        self.connection.run_async()
+
+        self.pending = PendingSends()
+        self.messages = AppMessageService(self.connection)
+        self.messages.register_handler("ack", self.pending.on_ack)
+        self.messages.register_handler("nack", self.pending.on_nack)
+
+    def show_time(self, hour, minute, is_24h):
+        """
+        Send a time and wait until the watch has acknowledged it.
+
+        Raises:
+            RuntimeError: If the watch rejected it
+            TimeoutError: If it was not acknowledged within ACK_TIMEOUT
+        """
+        from libpebble2.services.appmessage import Uint8
+
+        hour_key, minute_key, format_key = self.keys
+        txid = self.messages.send_message(self.app_uuid, {
+            hour_key: Uint8(hour),
+            minute_key: Uint8(minute),
+            format_key: Uint8(int(is_24h)),
+        })
+        try:
+            self.pending.wait(txid, ACK_TIMEOUT)
+        except (RuntimeError, TimeoutError) as e:
+            raise type(e)(f"{self.platform}: {hour:02d}:{minute:02d}: {e}") from None
+
+    def screenshot(self):
+        """Grab the framebuffer as an (h, w, 3) uint8 RGB array."""
+        from libpebble2.services.screenshot import Screenshot
+
+        rows = Screenshot(self.connection).grab_image()
+        pixels = np.frombuffer(b"".join(bytes(row) for row in rows), dtype=np.uint8)
+        return pixels.reshape(len(rows), -1, 3)
+
+    def wait_for_frame(self, previous=None):
+        """
+        Poll the framebuffer until the watchface has finished drawing.
+
+        Ready once STABLE_FRAMES consecutive grabs are identical. A stable
+        frame with the digest previous (the one shown before the time was
+        sent) is only accepted at READY_TIMEOUT, in case the redraw has not
+        started yet.
+
+        Returns:
+            (frame, digest, seconds waited)
+
+        Raises:
+            TimeoutError: If the frame never held still for STABLE_FRAMES grabs
+        """
+        start = time.monotonic()
+        digest, streak = None, 0
+        while True:
+            frame = self.screenshot()
+            current = hashlib.sha256(frame.tobytes()).hexdigest()
+            streak = streak + 1 if current == digest else 1
+            digest = current
+            waited = time.monotonic() - start
+            if streak >= STABLE_FRAMES and (digest != previous or waited >= READY_TIMEOUT):
+                return frame, digest, waited
+            if waited >= READY_TIMEOUT:
+                raise TimeoutError(f"{self.platform}: frame not stable after {READY_TIMEOUT}s")
+            time.sleep(POLL_SECONDS)
+
+    def close(self):
+        self.connection.transport.close()
+
+
+def capture_time(session, shown, entry, output_dir):
+    """
+    Show one TIMES entry on a session's emulator and save the frame.
+
+    Args:
+        shown: Digest of the frame on screen before (see wait_for_frame())
+
+    Returns:
+        (Capture, digest of the frame now on screen)
+    """
+    hour, minute, is_24h, name = entry
+    session.show_time(hour, minute, is_24h)
+    frame, shown, waited = session.wait_for_frame(shown)
+    path = output_dir / session.platform / f"{name}.png"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.fromarray(frame).save(path)
+    compared = compare(path)
+    return Capture(path, compared[0] if compared else None, waited), shown
+
+
+def capture_platform(platform, times, output_dir):
+    """
+    Install the screenshot build on a platform and capture every time.
+
+    Returns:
+        List of Capture
+    """
+    pebble("install", "--emulator", platform)
+    session = EmulatorSession(platform)
+    results = []
+    try:
+        _, shown, _ = session.wait_for_frame()  # App launched and drawn
+        for entry in times:
+            capture, shown = capture_time(session, shown, entry, output_dir)
+            results.append(capture)
+    finally:
+        session.close()
+    return results
+
+
+def print_capture(capture, label):
+    """Print one line describing a saved screenshot."""
+    ready = f"ready in {capture.waited:.2f}s"
+    if capture.mismatched is None:
+        print(f"⚠️  {label}: captured, not compared ({ready})")
+    elif capture.mismatched:
+        print(f"⚠️  {label}: {capture.mismatched} pixels differ from the compositor ({ready})")
+    else:
+        print(f"✅ {label} ({ready})")
+
+
+def parse_time_arg(value):
+    """Parse a capture name like 09-41-12h into a TIMES entry."""
+    parsed = parse_time_name(value)
+    if parsed is None:
+        raise argparse.ArgumentTypeError(f"expected a name like 09-41-12h or 23-59-24h, got '{value}'")
+    return (*parsed, value)
+
+
+def main():
+    platforms = target_platforms()
+
+    parser = argparse.ArgumentParser(description="Capture emulator screenshots from one build.")
+    parser.add_argument("--platform", action="append", choices=platforms, metavar="NAME",
+                        help=f"platform to capture (repeatable; default: {' '.join(platforms)})")
+    parser.add_argument("--time", action="append", type=parse_time_arg, metavar="HH-MM-12h",
+                        help="time to capture (repeatable; default: the store times)")
+    parser.add_argument("--output", type=Path, default=OUTPUT_DIR,
+                        help=f"output directory (default: {OUTPUT_DIR})")
+    parser.add_argument("--no-build", action="store_true",
+                        help="reuse the existing screenshot-mode build")
+    args = parser.parse_args()
+    times = args.time or TIMES
+    platforms = args.platform or platforms
+
+    missing = sdk_missing()
+    if missing:
+        print(f"❌ {missing} not found: run inside the Pebble SDK environment")
+        return 1
+
+    start = time.perf_counter()
+    if not args.no_build:
+        print(f"🔄 Building {', '.join(platforms)} with SCREENSHOT_MODE=1...")
+        try:
+            build_screenshot_mode(platforms)
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            return 1
+
+    failed = 0
+    for platform in platforms:
+        print("=" * 50)
+        print(f"{platform}: {len(times)} time(s)")
+        try:
+            results = capture_platform(platform, times, args.output)
+        except (RuntimeError, TimeoutError) as e:
+            print(f"❌ {e}")
+            failed += 1
+            continue
+        for capture in results:
+            print_capture(capture, capture.path.name)
+
+    print("=" * 50)
+    print(f"{'✅' if not failed else '❌'} Captured in {time.perf_counter() - start:.1f}s: {args.output}")
+    print("   Run `pebble build` before installing: this build ignores the clock")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Capture the emulator screenshot matrix on every platform at once.
+
+asyncio counterpart of capture_emulator.py: after one screenshot-mode
+build, each platform's warm emulator (see emulator_pool.py) works
+through its own queue of times concurrently, so the 25-screenshot matrix
+takes about as long as one platform's run.
+
+- Each platform's emulator has its own QEMU and pypkjs ports and its own
+  flash (persist) state, which pebble_tool chooses and keeps per
+  platform, and its own emulator record (see emulator_pool.state_dir()),
+  so cold boots and installs run concurrently too. Each platform's
+  pebble output goes to its own log in <output>/logs/.
+- Every capture job runs under --job-timeout. A job that times out is
+  failed and its connection closed; the pool relaunches the watchface
+  before the platform's next time, and recycles an emulator that stops
+  answering or keeps failing.
+- Ctrl+C cancels every job and closes every connection; --fail-fast does
+  the same on the first failure.
+
+Emulators are left running, so the next run skips their boot;
+--shutdown stops them at the end instead.
+
+Usage:
+    python3 capture_parallel.py [--platform NAME ...] [--time HH-MM-12h ...]
+                                [--output DIR] [--no-build]
+                                [--job-timeout SECONDS] [--fail-fast]
+                                [--shutdown]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from capture_emulator import (
+    OUTPUT_DIR,
+    capture_time,
+    parse_time_arg,
+    print_capture,
+    sdk_missing,
+)
+from emulator_pool import EmulatorPool, pebble_async
+from generate_screenshots_programmatic import TIMES
+from layout import target_platforms
+
+# Seconds allowed for the build
+BUILD_TIMEOUT = 600
+
+# Default seconds allowed per capture job, and per connect or relaunch
+JOB_TIMEOUT = 60
+
+
+class CaptureFailed(Exception):
+    """A capture job failed and --fail-fast was given."""
+
+
+async def run_platform(pool, platform, times, output_dir, job_timeout, fail_fast, matrix):
+    """
+    Capture a platform's times in order on its warm emulator.
+
+    Results go into matrix[platform][name] as they complete: a Capture,
+    or the error message of a failed job.
+    """
+    results = matrix[platform]
+    for entry in times:
+        name = entry[3]
+        try:
+            warm = await pool.acquire(platform, job_timeout)
+            capture, warm.shown = await asyncio.wait_for(
+                asyncio.to_thread(capture_time, warm.session, warm.shown, entry, output_dir), job_timeout)
+        except Exception as e:
+            pool.release(platform, ok=False)
+            message = str(e) or (f"timed out after {job_timeout}s" if isinstance(e, asyncio.TimeoutError)
+                                 else type(e).__name__)
+            results[name] = message
+            print(f"❌ {platform}/{name}: {message}")
+            if fail_fast:
+                raise CaptureFailed(f"{platform}/{name}: {message}")
+            continue
+        pool.release(platform, ok=True)
+        results[name] = capture
+        print_capture(capture, f"{platform}/{name}")
+
+
+async def capture_matrix(platforms, times, output_dir, build, job_timeout, fail_fast, shutdown):
+    """
+    Build once, then capture every platform concurrently.
+
+    Returns:
+        ({platform: {name: Capture or error message}}, {platform: WarmEmulator})
+    """
+    if build:
+        print(f"🔄 Building {', '.join(platforms)} with SCREENSHOT_MODE=1...")
+        env = {**os.environ, "SCREENSHOT_MODE": "1", "BUILD_PLATFORMS": ",".join(platforms)}
+        await pebble_async("build", env=env, timeout=BUILD_TIMEOUT, log=output_dir / "logs" / "build.log")
+
+    # Blocking libpebble2 calls run in threads. A timed-out job's thread
+    # only ends once its closed connection errors out, so leave room for
+    # one straggler per platform beside its next job.
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(2 * len(platforms)))
+
+    matrix = {platform: {} for platform in platforms}
+    pool = EmulatorPool(platforms, output_dir / "logs")
+    tasks = [asyncio.create_task(run_platform(pool, platform, times, output_dir,
+                                              job_timeout, fail_fast, matrix))
+             for platform in platforms]
+    try:
+        await asyncio.gather(*tasks)
+    except CaptureFailed:
+        print("⚠️  Cancelling the remaining jobs (--fail-fast)")
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if shutdown:
+            pool.shutdown()
+        else:
+            pool.close()
+    return matrix, pool.emulators
+
+
+def print_matrix(matrix, times):
+    """Print a platform × time table of results."""
+    names = [entry[3] for entry in times]
+    print(f"{'':<10}" + "".join(f"{name:>11}" for name in names))
+    for platform, results in matrix.items():
+        cells = []
+        for name in names:
+            result = results.get(name)
+            if result is None:
+                cells.append("-")
+            elif isinstance(result, str):
+                cells.append("❌")
+            else:
+                cells.append("✅" if result.mismatched == 0 else "⚠️")
+        print(f"{platform:<10}" + "".join(f"{cell:>10}" for cell in cells))
+
+
+def main():
+    platforms = target_platforms()
+
+    parser = argparse.ArgumentParser(description="Capture emulator screenshots on all platforms at once.")
+    parser.add_argument("--platform", action="append", choices=platforms, metavar="NAME",
+                        help=f"platform to capture (repeatable; default: {' '.join(platforms)})")
+    parser.add_argument("--time", action="append", type=parse_time_arg, metavar="HH-MM-12h",
+                        help="time to capture (repeatable; default: the store times)")
+    parser.add_argument("--output", type=Path, default=OUTPUT_DIR,
+                        help=f"output directory (default: {OUTPUT_DIR})")
+    parser.add_argument("--no-build", action="store_true",
+                        help="reuse the existing screenshot-mode build")
+    parser.add_argument("--job-timeout", type=float, default=JOB_TIMEOUT, metavar="SECONDS",
+                        help=f"seconds allowed per capture (default: {JOB_TIMEOUT})")
+    parser.add_argument("--fail-fast", action="store_true",
+                        help="cancel every job on the first failure")
+    parser.add_argument("--shutdown", action="store_true",
+                        help="stop the emulators at the end instead of keeping them warm")
+    args = parser.parse_args()
+    times = args.time or TIMES
+    platforms = args.platform or platforms
+
+    missing = sdk_missing()
+    if missing:
+        print(f"❌ {missing} not found: run inside the Pebble SDK environment")
+        return 1
+
+    start = time.perf_counter()
+    (args.output / "logs").mkdir(parents=True, exist_ok=True)
+    try:
+        matrix, emulators = asyncio.run(capture_matrix(platforms, times, args.output, not args.no_build,
+                                                       args.job_timeout, args.fail_fast, args.shutdown))
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 1
+    except KeyboardInterrupt:
+        print("\n⚠️  Cancelled")
+        return 130
+
+    print("=" * 50)
+    print_matrix(matrix, times)
+    captured = sum(not isinstance(result, str) for results in matrix.values() for result in results.values())
+    total = len(platforms) * len(times)
+    installs = sum(warm.installs for warm in emulators.values())
+    recycles = sum(warm.recycles for warm in emulators.values())
+    print("=" * 50)
+    print(f"Emulators: {installs} install(s), {recycles} recycled, "
+          f"{'stopped' if args.shutdown else 'kept warm'}")
+    print(f"{'✅' if captured == total else '❌'} Captured {captured}/{total} in "
+          f"{time.perf_counter() - start:.1f}s: {args.output}")
+    print("   Run `pebble build` before installing: this build ignores the clock")
+    return 0 if captured == total else 1
+
+
+if __name__ == "__main__":
+    exit(main())
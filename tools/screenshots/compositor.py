@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+In-memory watchface compositor.
+
+Renders the watchface for any (platform, time, 12h/24h) request as a
+NumPy array, a PIL image or encoded PNG bytes, with no files written.
+Digits come from the shared digit atlas and are placed by the layout
+model (layout.py), which mirrors main_window_load() in src/main.c, and
+pixels a round display does not show are left black.
+
+Usage:
+    from compositor import render, render_png
+    frame = render("chalk", 9, 41)                   # (180, 180) uint8 array
+    png = render_png("emery", 23, 59, is_24h=True)   # PNG bytes
+
+    # Many frames at once, into one preallocated stack
+    frames = render_frames([(9, 41, False, "09-41-12h"), ...], "basalt")
+"""
+
+import io
+import re
+
+import numpy as np
+from PIL import Image
+
+from digit_atlas import DIGIT_HEIGHT, DIGIT_WIDTH, load_atlas, source_hash
+from layout import display_mask, platform_layout
+from pebble_palette import native_image
+
+# Digit index used for a hidden hour-tens quadrant (12h mode)
+BLANK = 10
+
+# Output colour depths, see frame_image()
+DEPTHS = ("native", "gray", "rgb")
+
+# Screenshot names encode the time, e.g. "09-41-12h" or "23-59-24h"
+TIME_NAME = re.compile(r"^(\d{2})-(\d{2})-(12|24)h$")
+
+# Quadrant tiles per (platform, digit source hash), see quadrant_tiles();
+# only tiles of the current digits are kept
+_tiles = {}
+
+
+def display_alpha(alpha, is_color):
+    """
+    Return the gray levels a white bitmap with this alpha shows on black.
+
+    Colour platforms draw the bitmaps with GCompOpSet and 2-bit alpha, so
+    white is blended onto black at 0/85/170/255. Black & white platforms
+    get 1-bit bitmaps where alpha is thresholded at 50%. Within the
+    visible display (layout.display_mask()) both match emulator captures,
+    which store the 2-bit levels as 84/171 instead of 85/170.
+    """
+    if is_color:
+        return ((alpha.astype(np.uint16) * 3 + 127) // 255 * 85).astype(np.uint8)
+    return np.where(alpha >= 128, 255, 0).astype(np.uint8)
+
+
+def load_digit_stack(is_color):
+    """
+    Build an (11, 84, 72) uint8 digit stack from the shared digit atlas.
+
+    Index 10 is an all-black blank used when the hour tens digit is hidden.
+    Digits are drawn as the platform displays them (see display_alpha()).
+    """
+    stack = np.zeros((BLANK + 1, DIGIT_HEIGHT, DIGIT_WIDTH), dtype=np.uint8)
+    stack[:BLANK] = display_alpha(load_atlas()[..., 1], is_color)
+    return stack
+
+
+def display_digits(hour, minute, is_24h):
+    """
+    Return the four digits shown for a time, mirroring update_time() in main.c.
+
+    Returns:
+        (hour_tens, hour_ones, min_tens, min_ones), with hour_tens set to
+        BLANK when it is hidden in 12h mode
+    """
+    # Convert hour based on format
+    if not is_24h:
+        hour = hour % 12
+        if hour == 0:
+            hour = 12
+
+    hour_tens = hour // 10
+    if not is_24h and hour_tens == 0:
+        hour_tens = BLANK
+
+    return (hour_tens, hour % 10, minute // 10, minute % 10)
+
+
+def quadrant_tiles(platform):
+    """
+    Return the pre-rendered quadrant tiles for a platform.
+
+    Each quadrant gets an (11, layer height, layer width) uint8 stack: one
+    tile per digit plus BLANK, with the digit already padded and clipped
+    inside its BitmapLayer frame the way main.c draws it. Tiles are cached
+    per platform for the current digit PNGs and rebuilt when they change.
+
+    Returns:
+        List of four tile stacks in layout.frames order
+    """
+    digest = source_hash()
+    key = (platform, digest)
+    tiles = _tiles.get(key)
+    if tiles is None:
+        for old in list(_tiles):  # Drop tiles of older digits
+            if old[1] != digest:
+                _tiles.pop(old, None)
+        layout = platform_layout(platform)
+        digits = load_digit_stack(layout.is_color)
+        tiles = []
+        for frame, quad in zip(layout.frames, layout.quadrants):
+            tile = np.zeros((BLANK + 1, frame.h, frame.w), dtype=np.uint8)
+            x, y = quad.x - frame.x, quad.y - frame.y
+            tile[:, y:y + quad.h, x:x + quad.w] = digits[:, :quad.h, :quad.w]
+            tiles.append(tile)
+        _tiles[key] = tiles
+    return tiles
+
+
+def render_frames(times, platform="aplite", out=None):
+    """
+    Composite many times into one preallocated frame stack.
+
+    Frames are assembled from quadrant_tiles() by four block copies each,
+    with no per-frame alpha compositing. On round displays the pixels
+    outside the visible disc (layout.display_mask()) are then cleared.
+
+    Args:
+        times: Sequence of (hour, minute, is_24h, filename) entries
+        platform: Platform whose layout and colour depth to use
+        out: Optional (len(times), height, width) uint8 array to render into
+
+    Returns:
+        The (len(times), height, width) uint8 frame stack
+    """
+    layout = platform_layout(platform)
+    tiles = quadrant_tiles(platform)
+    count = len(times)
+    if out is None:
+        out = np.zeros((count, layout.height, layout.width), dtype=np.uint8)
+    else:
+        out[:count] = 0
+
+    index = [display_digits(h, m, is_24h) for h, m, is_24h, _ in times]
+
+    # Tiles cover their whole layer; pixels outside every layer (the row
+    # between the two rows, the round inset) stay black
+    for q, (frame, quad_tiles) in enumerate(zip(layout.frames, tiles)):
+        region = out[:count, frame.y:frame.y + frame.h, frame.x:frame.x + frame.w]
+        for i, digits in enumerate(index):
+            region[i] = quad_tiles[digits[q]]
+
+    if layout.is_round:
+        out[:count, ~display_mask(platform)] = 0
+
+    return out
+
+
+def frame_image(frame, platform, depth="native"):
+    """
+    Convert a rendered frame to an image at the requested colour depth.
+
+    Args:
+        frame: (height, width) uint8 gray frame from render_frames()
+        platform: Platform the frame was rendered for
+        depth: "native" (1-bit or GColor8 palette, as on the device),
+            "gray" (8-bit grayscale) or "rgb" (24-bit)
+
+    Returns:
+        (image, save params) to pass to Image.save
+    """
+    if depth == "native":
+        return native_image(frame, platform_layout(platform).is_color)
+    image = Image.fromarray(frame, "L")
+    if depth == "rgb":
+        image = image.convert("RGB")
+    return image, {}
+
+
+def parse_time_name(name):
+    """
+    Parse a screenshot name such as '09-41-12h'.
+
+    Returns:
+        (hour, minute, is_24h), or None if the name does not encode a time
+    """
+    match = TIME_NAME.match(name)
+    if not match:
+        return None
+    hour, minute = int(match.group(1)), int(match.group(2))
+    if hour > 23 or minute > 59:
+        return None
+    return hour, minute, match.group(3) == "24"
+
+
+def render(platform, hour, minute, is_24h=False):
+    """Render one time as a (height, width) uint8 gray array."""
+    return render_frames([(hour, minute, is_24h, "")], platform)[0]
+
+
+def render_image(platform, hour, minute, is_24h=False, depth="native"):
+    """Render one time as a PIL image at the requested colour depth."""
+    image, _ = frame_image(render(platform, hour, minute, is_24h), platform, depth)
+    return image
+
+
+def render_png(platform, hour, minute, is_24h=False, depth="native"):
+    """Render one time as encoded PNG bytes."""
+    image, params = frame_image(render(platform, hour, minute, is_24h), platform, depth)
+    buf = io.BytesIO()
+    image.save(buf, "PNG", **params)
+    return buf.getvalue()
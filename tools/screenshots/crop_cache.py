@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Persisted crop rectangles of emulator captures.
+
+Captures taken from the same emulator window have the display at the
+same offset, so the rectangle found for one can be reused for all of
+them. Entries are keyed by the capture's signature: its size, the
+platform (or target size) it is cropped for, and a hash of its outermost
+rows and columns, which show window chrome and not the watchface.
+
+Each entry keeps a sample of the pixels in the ring just outside the
+display. Before a cached rectangle is used those pixels are read back
+from the new capture and compared, so a window that moved or changed
+theme falls back to a full search instead of a wrong crop.
+
+The cache lives in build/cache/crop-geometry.json.
+
+Usage:
+    python3 crop_cache.py         # List the cached rectangles
+    python3 crop_cache.py --clear # Forget them
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+# Paths
+PROJECT_DIR = Path(__file__).resolve().parent.parent.parent
+CACHE_PATH = PROJECT_DIR / "build" / "cache" / "crop-geometry.json"
+
+# Bump when the cache file layout or the signature changes
+CACHE_VERSION = 1
+
+# Ring pixels sampled to verify a cached rectangle
+RING_SAMPLES = 64
+
+# Largest difference in a sampled pixel's R+G+B still counted as the same chrome
+RING_TOLERANCE = 6
+
+
+def signature(gray, target):
+    """
+    Return the cache key of a capture.
+
+    Args:
+        gray: Capture as an integer grayscale array (see crop_screenshots.to_gray)
+        target: Platform name, or "WxH" when cropping to an explicit size
+    """
+    edges = np.concatenate([gray[0], gray[-1], gray[:, 0], gray[:, -1]])
+    chrome = hashlib.sha256(edges.astype(np.int32).tobytes()).hexdigest()[:16]
+    height, width = gray.shape
+    return f"{width}x{height}/{target}/{chrome}"
+
+
+def ring_points(box, shape):
+    """
+    Return (ys, xs) of up to RING_SAMPLES pixels just outside a rectangle.
+
+    Points are spread evenly around the 1-pixel ring; those outside the
+    capture are dropped, so a display flush with the edge has fewer.
+    """
+    left, top, right, bottom = box
+    height, width = shape
+    xs = np.arange(left - 1, right + 1)
+    ys = np.arange(top, bottom)
+    points = np.concatenate([
+        np.stack([np.full_like(xs, top - 1), xs], axis=1),
+        np.stack([np.full_like(xs, bottom), xs], axis=1),
+        np.stack([ys, np.full_like(ys, left - 1)], axis=1),
+        np.stack([ys, np.full_like(ys, right)], axis=1),
+    ])
+    inside = ((points[:, 0] >= 0) & (points[:, 0] < height)
+              & (points[:, 1] >= 0) & (points[:, 1] < width))
+    points = points[inside]
+    if len(points) > RING_SAMPLES:
+        points = points[np.linspace(0, len(points) - 1, RING_SAMPLES).astype(int)]
+    return points[:, 0], points[:, 1]
+
+
+def make_entry(gray, box):
+    """Return the cache entry recording a rectangle and its ring pixels."""
+    ys, xs = ring_points(box, gray.shape)
+    return {"box": list(box), "ring": gray[ys, xs].tolist()}
+
+
+def verify(gray, entry):
+    """Whether a capture's ring pixels still match a cached entry."""
+    ys, xs = ring_points(entry["box"], gray.shape)
+    if len(ys) != len(entry["ring"]):
+        return False
+    return bool(np.all(np.abs(gray[ys, xs] - np.asarray(entry["ring"])) <= RING_TOLERANCE))
+
+
+class GeometryCache:
+    """Crop rectangles by capture signature, loaded from and saved to JSON."""
+
+    def __init__(self, path=CACHE_PATH):
+        self.path = Path(path)
+        self.entries = {}
+        self.load()
+
+    def load(self):
+        """Load the cache, starting empty if it is missing or unreadable."""
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != CACHE_VERSION:
+            return
+        self.entries = data.get("entries", {})
+
+    def save(self):
+        """Write the cache atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"version": CACHE_VERSION, "entries": self.entries}, f, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def knows(self, width, height, target):
+        """Whether any entry is for captures of this size and target."""
+        prefix = f"{width}x{height}/{target}/"
+        return any(key.startswith(prefix) for key in self.entries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show or clear the cached crop rectangles.")
+    parser.add_argument("--clear", action="store_true", help="forget every cached rectangle")
+    args = parser.parse_args()
+
+    if args.clear:
+        CACHE_PATH.unlink(missing_ok=True)
+        print(f"✅ Cleared {CACHE_PATH}")
+        return 0
+
+    cache = GeometryCache()
+    print(f"Crop cache: {CACHE_PATH}")
+    print(f"  Entries: {len(cache.entries)}")
+    for key, entry in sorted(cache.entries.items()):
+        left, top, right, bottom = entry["box"]
+        print(f"  {key}: ({left}, {top}) {right - left}×{bottom - top}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -1,146 +1,569 @@
 #!/usr/bin/env python3
 """
 Crop Pebble emulator screenshots to just the watch display.
+
+When a capture is named after the time it shows (<platform>/HH-MM-12h.png,
+as the capture tools save them), the display is located by matching the
+compositor's render of that time against the capture. Otherwise, or if
+the match is not confident, the display is taken to be the region most
+darker than its surroundings.
+
+Without a width and height, directories are walked recursively and each
+capture is cropped to the display size of the platform directory it is
+in (e.g. captures/<platform>/). Captures are cropped on a
+process pool and replaced atomically, so an interrupted run never leaves
+a half-written PNG.
+
+The rectangle found for a capture is remembered per capture signature
+(see crop_cache.py), so later captures from the same emulator window are
+cropped without a search once their chrome pixels check out.
+
+HiDPI captures show the display at 2× or 3× its size. Each integer scale
+that fits is searched, and a display found at k× is reduced exactly in
+NumPy: one pixel per k×k block when the blocks are flat (pixel doubling),
+the block mean otherwise. LANCZOS is only used when the crop is not a
+whole multiple of the display, e.g. a capture smaller than it.
+
 Usage:
+  python3 crop_screenshots.py PATH [--jobs N] [--no-cache]  # Size from platform dirs
   python3 crop_screenshots.py <file.png> <width> <height>
   python3 crop_screenshots.py <directory> <width> <height>
 """
 
-import sys
+import argparse
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from PIL import Image
 import numpy as np
 
+from compositor import parse_time_name, render
+from crop_cache import GeometryCache, make_entry, signature, verify
+from layout import DISPLAYS
+
+# Paths
+PROJECT_DIR = Path(__file__).resolve().parent.parent.parent
+
+# Width of the ring around a candidate display compared against it
+BORDER = 2
+
+# Lowest normalised cross-correlation accepted from a reference match
+MIN_CONFIDENCE = 0.8
+
+# Whole-number display scales searched for (Retina captures are 2× or 3×)
+SCALES = (1, 2, 3)
+
+# Largest share of pixel-to-pixel change inside k×k blocks for a crop to
+# count as pixel-scaled by k
+SCALED_MAX_INNER = 0.1
+
+
+def image_pixels(img):
+    """
+    Return a screenshot's pixels as an L, RGB or RGBA array.
+
+    Palette ("P") and 1-bit images, such as screenshots written at native
+    depth, decode to palette indices or bools, and LA to two channels, so
+    every other mode is converted to RGBA first.
+    """
+    if img.mode not in ("L", "RGB", "RGBA"):
+        img = img.convert("RGBA")
+    return np.asarray(img)
+
+
+def to_gray(img_array):
+    """
+    Return an integer grayscale (sum of R, G and B) copy of a screenshot.
+
+    Args:
+        img_array: Pixels from image_pixels()
+
+    Transparent pixels (window shadows and corners in macOS captures)
+    count as white, like the chrome around the display.
+    """
+    if img_array.ndim == 2:
+        return img_array.astype(np.int64) * 3
+
+    rgb = img_array[..., :3].astype(np.int64)
+    if img_array.shape[2] == 4:
+        alpha = img_array[..., 3:4].astype(np.int64)
+        rgb = (rgb * alpha + 255 * (255 - alpha)) // 255
+    return rgb.sum(axis=2)
+
+
+def integral_image(gray):
+    """Summed-area table with a zero first row and column."""
+    sat = np.zeros((gray.shape[0] + 1, gray.shape[1] + 1), dtype=np.int64)
+    np.cumsum(np.cumsum(gray, axis=0), axis=1, out=sat[1:, 1:])
+    return sat
+
+
+def window_sums(sat, height, width):
+    """Sum of every height×width window, indexed by its top-left corner."""
+    return (sat[height:, width:] - sat[:-height, width:]
+            - sat[height:, :-width] + sat[:-height, :-width])
+
 
 def find_watch_display(img_array, target_width, target_height):
     """
     Find the watch display (black rectangle) in the emulator screenshot.
+
+    Every pixel offset is scored by how much darker the target-sized
+    window is than the darkest of the four BORDER-wide strips around it,
+    using a summed-area table so each score is O(1). All four strips fall
+    on the lighter emulator chrome only when the window covers the
+    display exactly, so the best score is pixel-exact. Ties (e.g. a
+    uniformly black capture) go to the offset closest to the centre.
+
     Returns (left, top, right, bottom) crop coordinates.
     """
-    # Convert to grayscale for easier processing
-    if len(img_array.shape) == 3:
-        gray = np.mean(img_array, axis=2)
-    else:
-        gray = img_array
+    gray = to_gray(img_array)
+    img_height, img_width = gray.shape
+
+    if img_width < target_width or img_height < target_height:
+        # Smaller than the display: centre it and let the crop pad
+        left = (img_width - target_width) // 2
+        top = (img_height - target_height) // 2
+        return (left, top, left + target_width, top + target_height)
+
+    rows = img_height - target_height + 1
+    cols = img_width - target_width + 1
+
+    # Outside the capture repeats its edge pixels: a window pushed against
+    # the edge gets the chrome it already had there, no brighter ring
+    padded = np.pad(gray, BORDER, mode="edge")
+    sat = integral_image(padded)
+
+    # Window sums in padded coordinates, where offset (0, 0) of a strip
+    # BORDER rows above the window is its top-left corner
+    horizontal = window_sums(sat, BORDER, target_width + 2 * BORDER)
+    vertical = window_sums(sat, target_height, BORDER)
+    inner = window_sums(sat, target_height, target_width)[BORDER:BORDER + rows, BORDER:BORDER + cols]
+    strips = [
+        horizontal[:rows, :cols],
+        horizontal[BORDER + target_height:BORDER + target_height + rows, :cols],
+        vertical[BORDER:BORDER + rows, :cols],
+        vertical[BORDER:BORDER + rows, BORDER + target_width:BORDER + target_width + cols],
+    ]
+    strip_areas = [BORDER * (target_width + 2 * BORDER)] * 2 + [BORDER * target_height] * 2
+    score = (np.minimum.reduce([strip / area for strip, area in zip(strips, strip_areas)])
+             - inner / (target_width * target_height))
+
+    # Among equal scores prefer the one nearest the centre
+    tops, lefts = np.nonzero(score == score.max())
+    centre_top = (img_height - target_height) / 2
+    centre_left = (img_width - target_width) / 2
+    nearest = np.argmin((tops - centre_top) ** 2 + (lefts - centre_left) ** 2)
+    top, left = int(tops[nearest]), int(lefts[nearest])
+
+    return (left, top, left + target_width, top + target_height)
+
+
+def is_pixel_scaled(gray, scale):
+    """
+    Whether a grayscale crop is an image enlarged scale× by pixel repetition.
+
+    Neighbouring pixels then only differ across block boundaries, so the
+    change inside blocks must be under SCALED_MAX_INNER of all change.
+    """
+    inner = total = 0
+    for axis in (0, 1):
+        steps = np.abs(np.diff(gray, axis=axis))
+        within = np.arange(steps.shape[axis]) % scale != scale - 1
+        inner += np.compress(within, steps, axis=axis).sum()
+        total += steps.sum()
+    return total > 0 and inner <= SCALED_MAX_INNER * total
+
+
+def fitting_scales(shape, target_width, target_height):
+    """Return the SCALES at which the display fits a capture of this shape."""
+    return [scale for scale in SCALES
+            if target_width * scale <= shape[1] and target_height * scale <= shape[0]]
+
 
-    # The watch display should be a contiguous dark region
-    # Strategy: Center crop assuming display is roughly centered
+def match_template(gray, template):
+    """
+    Normalised cross-correlation of a template at every offset.
+
+    The correlation of all offsets comes from one FFT product; window
+    means and variances come from summed-area tables. Scores are in
+    [-1, 1] and do not change with the brightness or contrast of the
+    capture, so light emulator themes match as well as dark ones.
+
+    Returns:
+        (H - h + 1, W - w + 1) score array, indexed by top-left offset
+    """
     img_height, img_width = gray.shape
+    height, width = template.shape
+    gray = gray.astype(np.float64)
+    centred = template.astype(np.float64) - template.mean()
 
-    # Calculate center crop
-    left = (img_width - target_width) // 2
-    top = (img_height - target_height) // 2
-    right = left + target_width
-    bottom = top + target_height
+    # Circular correlation; offsets inside the valid range never wrap
+    spectrum = np.fft.rfft2(gray) * np.conj(np.fft.rfft2(centred, s=gray.shape))
+    correlation = np.fft.irfft2(spectrum, s=gray.shape)[:img_height - height + 1,
+                                                        :img_width - width + 1]
 
-    # Ensure we don't go out of bounds
-    if right > img_width or bottom > img_height:
-        # Image is smaller than expected, try to find the best crop
-        # Look for the darkest region
-        min_left = max(0, (img_width - target_width) // 2 - 50)
-        max_left = min(img_width - target_width, (img_width - target_width) // 2 + 50)
-        min_top = max(0, (img_height - target_height) // 2 - 50)
-        max_top = min(img_height - target_height, (img_height - target_height) // 2 + 50)
+    count = height * width
+    sums = window_sums(integral_image(gray), height, width)
+    squares = window_sums(integral_image(gray * gray), height, width)
+    variance = np.maximum(squares - sums * sums / count, 0)
+    denominator = np.sqrt(variance * (centred * centred).sum())
 
-        darkest_score = float('inf')
-        best_crop = (left, top, right, bottom)
+    scores = np.zeros_like(correlation)
+    np.divide(correlation, denominator, out=scores, where=denominator > 1e-6 * count)
+    return scores
 
-        for test_left in range(min_left, max_left, 5):
-            for test_top in range(min_top, max_top, 5):
-                test_right = test_left + target_width
-                test_bottom = test_top + target_height
 
-                if test_right <= img_width and test_bottom <= img_height:
-                    crop_region = gray[test_top:test_bottom, test_left:test_right]
-                    score = np.mean(crop_region)
+def locate_display(img_array, reference):
+    """
+    Find where a reference frame appears in a capture.
 
-                    if score < darkest_score:
-                        darkest_score = score
-                        best_crop = (test_left, test_top, test_right, test_bottom)
+    Args:
+        img_array: Capture pixels (gray, RGB or RGBA)
+        reference: (height, width) frame the display is expected to show,
+            e.g. compositor.render() of the captured time
 
-        return best_crop
+    Returns:
+        ((left, top, right, bottom), confidence), with confidence the
+        normalised cross-correlation at the best offset, or (None, 0.0)
+        if the capture is smaller than the reference
+    """
+    gray = to_gray(img_array)
+    height, width = reference.shape
+    if gray.shape[0] < height or gray.shape[1] < width:
+        return None, 0.0
 
-    return (left, top, right, bottom)
+    scores = match_template(gray, reference)
+    top, left = np.unravel_index(np.argmax(scores), scores.shape)
+    top, left = int(top), int(left)
+    return (left, top, left + width, top + height), float(scores[top, left])
 
 
-def crop_image(input_path, output_path, target_width, target_height):
-    """Crop a single image to target dimensions."""
-    try:
-        img = Image.open(input_path)
-        img_array = np.array(img)
+def locate(img_array, path, target_width, target_height):
+    """
+    Find the display in a capture, at whichever integer scale it is shown.
 
-        # Find the watch display
-        left, top, right, bottom = find_watch_display(img_array, target_width, target_height)
+    The reference frame for the path (see reference_frame()) is matched
+    at every scale that fits, upscaled by pixel doubling, and the best
+    score wins if it reaches MIN_CONFIDENCE. Otherwise the darkest region
+    is searched from the largest scale down, and the first whose crop is
+    pixel-scaled by that factor (see is_pixel_scaled()) wins; smoothed
+    HiDPI captures therefore need a reference frame.
 
-        # Crop
-        cropped = img.crop((left, top, right, bottom))
+    Returns:
+        ((left, top, right, bottom), method, confidence) with method
+        "reference" or "darkest" and confidence None without a reference
+    """
+    scales = fitting_scales(img_array.shape, target_width, target_height)
+    reference = reference_frame(path, target_width, target_height) if path else None
+    confidence = None
+    if reference is not None and scales:
+        matches = [locate_display(img_array, reference.repeat(scale, axis=0).repeat(scale, axis=1))
+                   for scale in scales]
+        box, confidence = max(matches, key=lambda match: match[1])
+        if confidence >= MIN_CONFIDENCE:
+            return box, "reference", confidence
 
-        # Verify dimensions
-        if cropped.size != (target_width, target_height):
-            print(f"    Warning: Cropped size {cropped.size} != target {(target_width, target_height)}")
-            print(f"    Resizing to target dimensions...")
-            cropped = cropped.resize((target_width, target_height), Image.Resampling.LANCZOS)
+    gray = to_gray(img_array)
+    for scale in reversed(scales[1:]):
+        left, top, right, bottom = box = find_watch_display(
+            img_array, target_width * scale, target_height * scale)
+        if is_pixel_scaled(gray[top:bottom, left:right], scale):
+            return box, "darkest", confidence
+    return find_watch_display(img_array, target_width, target_height), "darkest", confidence
 
-        # Save
-        cropped.save(output_path)
-        return True
-    except Exception as e:
-        print(f"    Error cropping {input_path}: {e}")
-        return False
 
+def downsample(pixels, scale):
+    """
+    Reduce an image array by a whole-number factor.
 
-def main():
-    if len(sys.argv) != 4:
-        print("Usage:")
-        print("  python3 crop_screenshots.py <file.png> <width> <height>")
-        print("  python3 crop_screenshots.py <directory> <width> <height>")
-        print("\nExamples:")
-        print("  python3 crop_screenshots.py screenshot.png 144 168")
-        print("  python3 crop_screenshots.py store-assets/screenshots/aplite/ 144 168")
-        return 1
+    Returns:
+        (pixels, "pick") when every scale×scale block is one flat color,
+        taking one pixel per block; otherwise (block means, "box")
+    """
+    height, width = pixels.shape[0] // scale, pixels.shape[1] // scale
+    blocks = pixels.reshape(height, scale, width, scale, -1)
+    if (blocks == blocks[:, :1, :, :1]).all():
+        return pixels[::scale, ::scale], "pick"
+    means = np.round(blocks.mean(axis=(1, 3))).astype(pixels.dtype)
+    return means.reshape(height, width, *pixels.shape[2:]), "box"
 
-    input_path = Path(sys.argv[1])
-    target_width = int(sys.argv[2])
-    target_height = int(sys.argv[3])
 
-    if not input_path.exists():
-        print(f"Error: {input_path} does not exist")
-        return 1
+def fit_display(img, box, target_width, target_height):
+    """
+    Crop a display out of a capture at the target size.
+
+    A display exactly k times the target size is reduced with downsample();
+    anything else is resized with LANCZOS.
+
+    Returns:
+        (image, resample) with resample None if the crop was already the
+        target size, else "pick k×", "box k×" or "lanczos"
+    """
+    cropped = img.crop(box)
+    if cropped.size == (target_width, target_height):
+        return cropped, None
+
+    scale = cropped.size[0] // target_width
+    if scale > 1 and cropped.size == (target_width * scale, target_height * scale):
+        if cropped.mode not in ("L", "LA", "RGB", "RGBA"):
+            cropped = cropped.convert("RGBA")
+        pixels, how = downsample(np.asarray(cropped), scale)
+        return Image.fromarray(pixels, cropped.mode), f"{how} {scale}×"
+    return cropped.resize((target_width, target_height), Image.Resampling.LANCZOS), "lanczos"
+
+
+def path_platform(path):
+    """
+    Return the platform a capture belongs to.
+
+    The platform is the nearest parent directory named after one, so both
+    screenshots/basalt/x.png and screenshots/basalt/run-2/x.png are basalt.
+
+    Returns:
+        Platform name, or None if no parent directory names a platform
+    """
+    for parent in Path(path).resolve().parents:
+        if parent.name in DISPLAYS:
+            return parent.name
+    return None
+
+
+def platform_size(path):
+    """Return the display (width, height) of a capture's platform, or None."""
+    platform = path_platform(path)
+    return DISPLAYS[platform][:2] if platform else None
+
+
+def crop_target(path, target_width, target_height):
+    """Return what a capture is cropped for: its platform, or "WxH" if the size is explicit."""
+    platform = path_platform(path)
+    if platform and DISPLAYS[platform][:2] == (target_width, target_height):
+        return platform
+    return f"{target_width}x{target_height}"
+
+
+def reference_frame(path, target_width, target_height):
+    """
+    Render the frame a capture should show, from its path.
+
+    The time comes from the file name (HH-MM-12h / HH-MM-24h); the
+    platform from the parent directories, or else the first platform with
+    a display of the target size.
+
+    Returns:
+        (height, width) uint8 frame, or None if the path names no time
+    """
+    parsed = parse_time_name(Path(path).stem)
+    if parsed is None:
+        return None
+
+    platform = path_platform(path)
+    if DISPLAYS.get(platform, (None, None))[:2] != (target_width, target_height):
+        platform = next((name for name, (w, h, _, _) in DISPLAYS.items()
+                         if (w, h) == (target_width, target_height)), None)
+    if platform is None:
+        return None
+    return render(platform, *parsed)
+
+
+def find_pngs(path):
+    """Return the PNG files under a path (recursively), sorted."""
+    if path.is_file():
+        return [path]
+    return sorted(path.rglob("*.png"))
+
+
+# Outcome of cropping one capture: how the display was found (cached,
+# reference or darkest), the reference match score (None without one),
+# the size before cropping, how it was resized (see fit_display()), the
+# error message if it failed, and the capture signature with the
+# geometry cache entry learned from it
+CropResult = namedtuple("CropResult", "path ok method confidence size resample error key entry")
+
+
+def crop_image(input_path, output_path, target_width, target_height, geometry=None):
+    """
+    Crop a single image to target dimensions.
+
+    The output is written to a temporary file next to it and renamed into
+    place, so it can safely be the input.
+
+    Args:
+        geometry: Known crop rectangles (GeometryCache.entries); a verified
+            entry for the capture's signature skips the search
+
+    Returns:
+        CropResult; entry is set when a search found a rectangle to cache
+    """
+    try:
+        with Image.open(input_path) as opened:
+            img = opened.copy()
+        img_array = image_pixels(img)
+        gray = to_gray(img_array)
+        key = signature(gray, crop_target(input_path, target_width, target_height))
 
-    # Process single file or directory
-    if input_path.is_file():
-        print(f"Cropping {input_path.name} to {target_width}×{target_height}...")
-        success = crop_image(input_path, input_path, target_width, target_height)
-        if success:
-            print(f"✅ Cropped successfully")
-            return 0
+        # Reuse the rectangle of an earlier capture from the same window,
+        # else find the watch display, by reference frame when the name
+        # gives the time
+        entry, confidence = None, None
+        cached = (geometry or {}).get(key)
+        if cached is not None and verify(gray, cached):
+            box, method = tuple(cached["box"]), "cached"
         else:
-            return 1
+            box, method, confidence = locate(img_array, input_path, target_width, target_height)
 
-    elif input_path.is_dir():
-        print(f"Cropping all PNG files in {input_path} to {target_width}×{target_height}...\n")
+        cropped, resample = fit_display(img, box, target_width, target_height)
+        if method != "cached" and resample != "lanczos":
+            entry = make_entry(gray, box)
+
+        output_path = Path(output_path)
+        tmp_path = output_path.with_name(f".{output_path.stem}.{os.getpid()}.tmp.png")
+        try:
+            cropped.save(tmp_path)
+            os.replace(tmp_path, output_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return CropResult(input_path, True, method, confidence, img.size, resample, None, key, entry)
+    except Exception as e:
+        return CropResult(input_path, False, None, None, None, None, str(e), None, None)
 
-        png_files = list(input_path.glob("*.png"))
-        if not png_files:
-            print(f"No PNG files found in {input_path}")
-            return 1
 
-        success_count = 0
-        for png_file in png_files:
-            print(f"Processing {png_file.name}...")
-            if crop_image(png_file, png_file, target_width, target_height):
-                success_count += 1
-                print(f"  ✅ Cropped")
-            else:
-                print(f"  ❌ Failed")
+def crop_job(path, target_width, target_height, geometry=None):
+    """Crop one capture in place; runs in a worker process when jobs > 1."""
+    return crop_image(path, path, target_width, target_height, geometry)
 
-        print(f"\n✅ Processed {success_count}/{len(png_files)} files")
-        return 0
 
+def crop_wave(jobs, workers, geometry):
+    """Crop (path, width, height) jobs against a snapshot of known geometry."""
+    if workers == 1 or len(jobs) < 2:
+        return [crop_job(*job, geometry) for job in jobs]
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(crop_job, *zip(*jobs), [geometry] * len(jobs), chunksize=chunksize))
+
+
+def run_jobs(jobs, workers=1, cache=None):
+    """
+    Crop (path, width, height) jobs, on a process pool when workers > 1.
+
+    With a GeometryCache, one capture of every size and target the cache
+    has not seen is cropped first, so the rest of the batch can reuse the
+    rectangles it learned. Learned rectangles are added to the cache.
+    A capture that cannot be read is left to crop_image(), which reports
+    it as a failed CropResult.
+
+    Returns:
+        CropResult per job, in job order
+    """
+    geometry = cache.entries if cache is not None else None
+    scouts, seen = [], set()
+    if cache is not None:
+        for index, (path, width, height) in enumerate(jobs):
+            try:
+                with Image.open(path) as image:
+                    group = (*image.size, crop_target(path, width, height))
+            except OSError:
+                continue
+            if group not in seen and not cache.knows(*group):
+                scouts.append(index)
+            seen.add(group)
+
+    results = [None] * len(jobs)
+    rest = sorted(set(range(len(jobs))) - set(scouts))
+    for wave in (scouts, rest):
+        for index, result in zip(wave, crop_wave([jobs[i] for i in wave], workers, geometry)):
+            results[index] = result
+            if cache is not None and result.entry is not None:
+                cache.entries[result.key] = result.entry
+    return results
+
+
+def print_result(result, root):
+    """Print one line describing how a capture was cropped."""
+    try:
+        name = result.path.relative_to(root)
+    except ValueError:
+        name = result.path
+    if not result.ok:
+        print(f"❌ {name}: {result.error}")
+        return
+
+    how = result.method
+    if result.confidence is not None:
+        how += f" {result.confidence:.2f}"
+    if result.resample is None:
+        note = ""
+    elif result.resample == "lanczos":
+        note = "  ⚠️  lanczos"
     else:
-        print(f"Error: {input_path} is neither a file nor directory")
+        note = f"  → {result.resample}"
+    print(f"✅ {name}  {result.size[0]}×{result.size[1]}  {how}{note}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Crop emulator screenshots to the watch display.")
+    parser.add_argument("path", type=Path,
+                        help="PNG file or directory, walked recursively; files are cropped in place")
+    parser.add_argument("width", nargs="?", type=int,
+                        help="display width (default: from the platform directory)")
+    parser.add_argument("height", nargs="?", type=int,
+                        help="display height (default: from the platform directory)")
+    parser.add_argument("--jobs", type=int, default=0, metavar="N",
+                        help="crop on N processes (default: 0 = all cores)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="search every capture, ignoring and not updating the crop cache")
+    args = parser.parse_args()
+    workers = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    if (args.width is None) != (args.height is None):
+        parser.error("give both width and height, or neither")
+    if not args.path.exists():
+        print(f"Error: {args.path} does not exist")
+        return 1
+
+    png_files = find_pngs(args.path)
+    if not png_files:
+        print(f"No PNG files found in {args.path}")
         return 1
 
+    # Target size per capture: explicit, or from its platform directory
+    jobs = []
+    for png_file in png_files:
+        size = (args.width, args.height) if args.width else platform_size(png_file)
+        if size is None:
+            print(f"⏭️  {png_file}: not in a platform directory, give width and height")
+            continue
+        jobs.append((png_file, *size))
+    if not jobs:
+        print("No screenshots to crop")
+        return 1
+
+    root = args.path if args.path.is_dir() else args.path.parent
+    print(f"Cropping {len(jobs)} screenshot(s) in {args.path} ({workers} job(s))...")
+    print("=" * 50)
+    cache = None if args.no_cache else GeometryCache()
+    results = run_jobs(jobs, workers, cache)
+    for result in results:
+        print_result(result, root)
+    if cache is not None:
+        cache.save()
+
+    succeeded = sum(result.ok for result in results)
+    print("=" * 50)
+    if cache is not None:
+        cached = sum(result.method == "cached" for result in results)
+        print(f"   {cached} cropped from cached geometry, {succeeded - cached} searched")
+    paths = {}
+    for result in results:
+        if result.ok:
+            path = (result.resample or "1×").split()[0]
+            paths[path] = paths.get(path, 0) + 1
+    print("   Scaling: " + ", ".join(f"{count} {path}" for path, count in sorted(paths.items())))
+    print(f"{'✅' if succeeded == len(jobs) else '⚠️ '} Processed {succeeded}/{len(jobs)} files")
+    return 0 if succeeded == len(jobs) else 1
+
 
 if __name__ == "__main__":
     exit(main())
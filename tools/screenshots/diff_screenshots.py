@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Compare screenshot PNGs against in-memory renders of the same time.
+
+The platform comes from the parent directory and the time from the file
+name (e.g. screenshots/chalk/09-41-12h.png), so emulator captures and
+programmatic screenshots can both be checked against the compositor
+without writing anything to disk. Files whose name does not encode a
+time are skipped.
+
+Usage:
+    python3 diff_screenshots.py [PATH ...] [--tolerance N] [--diff-dir DIR]
+
+Examples:
+    python3 diff_screenshots.py                       # All store screenshots
+    python3 diff_screenshots.py ../../store-assets/screenshots/emery
+    python3 diff_screenshots.py --diff-dir /tmp/diffs # Write diff images
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from compositor import parse_time_name, render
+from layout import DISPLAYS
+
+# Paths
+PROJECT_DIR = Path(__file__).resolve().parent.parent.parent
+SCREENSHOTS_DIR = PROJECT_DIR / "store-assets" / "screenshots"
+
+# Emulator captures store the 2-bit gray levels as 84/171 where the
+# compositor uses 85/170, so off-by-one pixels are not real differences
+TOLERANCE = 2
+
+
+def find_screenshots(paths):
+    """Expand files and directories into a sorted list of PNG paths."""
+    found = []
+    for path in paths:
+        if path.is_dir():
+            found.extend(path.rglob("*.png"))
+        else:
+            found.append(path)
+    return sorted(found)
+
+
+def compare(path, tolerance=TOLERANCE):
+    """
+    Compare one screenshot with the render of its platform and time.
+
+    Args:
+        path: Screenshot path, named <platform>/<HH-MM-12h|24h>.png
+        tolerance: Largest per-pixel gray difference still counted as equal
+
+    Returns:
+        (mismatched pixel count, diff mask) or None if the path does not
+        identify a platform and time. The diff mask is None when the
+        sizes differ.
+    """
+    platform = path.parent.name
+    parsed = parse_time_name(path.stem)
+    if platform not in DISPLAYS or parsed is None:
+        return None
+
+    expected = render(platform, *parsed)
+    with Image.open(path) as image:
+        actual = np.asarray(image.convert("L"))
+
+    if actual.shape != expected.shape:
+        return actual.size, None
+
+    mask = np.abs(actual.astype(np.int16) - expected) > tolerance
+    return int(mask.sum()), mask
+
+
+def write_diff(path, mask, diff_dir):
+    """Write a diff image (mismatched pixels in red over the capture)."""
+    with Image.open(path) as image:
+        overlay = np.array(image.convert("RGB"))
+    overlay[mask] = (255, 0, 0)
+
+    output_path = diff_dir / path.parent.name / path.name
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    Image.fromarray(overlay).save(output_path)
+    return output_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare screenshots with in-memory renders.")
+    parser.add_argument("paths", nargs="*", type=Path, default=[SCREENSHOTS_DIR],
+                        help=f"PNG files or directories (default: {SCREENSHOTS_DIR})")
+    parser.add_argument("--tolerance", type=int, default=TOLERANCE,
+                        help=f"per-pixel gray difference to ignore (default: {TOLERANCE})")
+    parser.add_argument("--diff-dir", type=Path,
+                        help="write diff images of mismatching screenshots here")
+    args = parser.parse_args()
+
+    compared = 0
+    mismatched = 0
+
+    print("Comparing screenshots with in-memory renders...")
+    print("=" * 50)
+    for path in find_screenshots(args.paths):
+        result = compare(path, args.tolerance)
+        if result is None:
+            continue
+        compared += 1
+        count, mask = result
+        name = f"{path.parent.name}/{path.name}"
+
+        if count == 0:
+            print(f"✅ {name}")
+            continue
+
+        mismatched += 1
+        if mask is None:
+            print(f"❌ {name}: size differs from the render")
+            continue
+        print(f"❌ {name}: {count} pixels differ ({count / mask.size:.2%})")
+        if args.diff_dir:
+            print(f"   Diff: {write_diff(path, mask, args.diff_dir)}")
+
+    print("=" * 50)
+    if compared == 0:
+        print("⚠️  No screenshots named <platform>/<HH-MM-12h|24h>.png found")
+        return 1
+    print(f"{compared - mismatched}/{compared} screenshots match")
+    return 1 if mismatched else 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Decoded digit atlas shared by the screenshot and banner tools.
+
+All ten resources/images/digit_N.png bitmaps (72×84, gray + alpha) are
+decoded once into a single contiguous (10, 84, 72, 2) uint8 array and
+persisted as a .npy file under build/cache/. Later runs memory-map that
+file instead of decoding the PNGs again. The cache file name carries a
+hash of the source PNG bytes, so editing any digit invalidates it.
+
+Usage:
+    from digit_atlas import load_atlas
+    atlas = load_atlas()        # atlas[7, :, :, 0] is the gray channel of 7
+
+    python3 digit_atlas.py      # Build (or verify) the cache
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+# Paths
+PROJECT_DIR = Path(__file__).resolve().parent.parent.parent
+RESOURCES = PROJECT_DIR / "resources" / "images"
+CACHE_DIR = PROJECT_DIR / "build" / "cache"
+
+# Atlas geometry
+DIGIT_COUNT = 10
+DIGIT_WIDTH = 72
+DIGIT_HEIGHT = 84
+
+# Decoded atlas loaded in this process, keyed by source hash. Only the
+# current digits are kept, so a long-running process does not pile up
+# an atlas per digit revision
+_loaded = {}
+
+# Source hash of the digit PNGs, keyed by their digit_signature(); only
+# the current signature is kept
+_source_hashes = {}
+
+
+def digit_path(num):
+    """Return the resource path of a digit bitmap."""
+    path = RESOURCES / f"digit_{num}.png"
+    if not path.exists():
+        raise FileNotFoundError(f"Digit image not found: {path}")
+    return path
+
+
+def digit_hashes():
+    """Return the hex SHA-256 of each digit PNG's bytes, indexed by digit."""
+    return [hashlib.sha256(digit_path(num).read_bytes()).hexdigest()
+            for num in range(DIGIT_COUNT)]
+
+
+def digit_signature():
+    """Return (size, mtime) of every digit PNG; cheap enough to check per render."""
+    signature = []
+    for num in range(DIGIT_COUNT):
+        stat = os.stat(digit_path(num))
+        signature.append((stat.st_size, stat.st_mtime_ns))
+    return tuple(signature)
+
+
+def source_hash():
+    """
+    Hash the bytes of all ten digit PNGs (hex SHA-256).
+
+    The PNGs are only read and hashed again when their digit_signature()
+    changes, so calling this per render costs ten stat() calls.
+    """
+    signature = digit_signature()
+    digest = _source_hashes.get(signature)
+    if digest is None:
+        digest = hashlib.sha256("".join(digit_hashes()).encode()).hexdigest()
+        _source_hashes.clear()
+        _source_hashes[signature] = digest
+    return digest
+
+
+def decode_atlas():
+    """Decode all digit PNGs into a fresh (10, 84, 72, 2) uint8 array."""
+    atlas = np.empty((DIGIT_COUNT, DIGIT_HEIGHT, DIGIT_WIDTH, 2), dtype=np.uint8)
+    for num in range(DIGIT_COUNT):
+        with Image.open(digit_path(num)) as digit:
+            if digit.size != (DIGIT_WIDTH, DIGIT_HEIGHT):
+                raise ValueError(f"digit_{num}.png is {digit.size[0]}×{digit.size[1]}, "
+                                 f"expected {DIGIT_WIDTH}×{DIGIT_HEIGHT}")
+            atlas[num] = np.asarray(digit.convert("LA"))
+    return atlas
+
+
+def cache_path(digest):
+    """Return the cache file for a given source hash."""
+    return CACHE_DIR / f"digit_atlas-{digest[:16]}.npy"
+
+
+def write_cache(atlas, digest):
+    """Persist an atlas atomically and remove caches for older sources."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = cache_path(digest)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        np.save(f, atlas)
+    os.replace(tmp_path, path)
+
+    for stale in CACHE_DIR.glob("digit_atlas-*.npy"):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+
+    return path
+
+
+def load_atlas():
+    """
+    Return the decoded digit atlas, building the cache if needed.
+
+    Returns:
+        Read-only (10, 84, 72, 2) uint8 array (gray, alpha), memory-mapped
+        from the cache file when one exists
+    """
+    digest = source_hash()
+    atlas = _loaded.get(digest)
+    if atlas is not None:
+        return atlas
+
+    path = cache_path(digest)
+    atlas = None
+    if path.exists():
+        try:
+            atlas = np.load(path, mmap_mode="r")
+        except (OSError, ValueError):
+            atlas = None
+        if atlas is not None and atlas.shape != (DIGIT_COUNT, DIGIT_HEIGHT, DIGIT_WIDTH, 2):
+            atlas = None
+
+    if atlas is None:
+        write_cache(decode_atlas(), digest)
+        atlas = np.load(path, mmap_mode="r")
+
+    _loaded.clear()
+    _loaded[digest] = atlas
+    return atlas
+
+
+def digit_image(num):
+    """Return one digit as a PIL 'LA' image backed by the atlas."""
+    return Image.fromarray(np.ascontiguousarray(load_atlas()[num]), "LA")
+
+
+def main():
+    digest = source_hash()
+    existed = cache_path(digest).exists()
+    atlas = load_atlas()
+    status = "Reused" if existed else "Built"
+    print(f"✅ {status} digit atlas {atlas.shape} ({atlas.nbytes} bytes)")
+    print(f"   Cache: {cache_path(digest)}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
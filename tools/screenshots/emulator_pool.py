@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Keep one booted emulator per platform and reuse it between capture jobs.
+
+Booting QEMU takes far longer than any capture, so the pool never boots
+one per job. Each platform keeps one emulator and one connection, and
+between jobs:
+
+- the watchface is installed on first use, then reinstalled only when
+  the build has changed (the .pbw is newer); installing on an emulator
+  that is already running does not reboot it
+- it is relaunched in place (AppRunStateStart) only after a failed job,
+  when its state is unknown
+- the emulator is pinged first; one that does not answer within
+  HEALTH_TIMEOUT, or that fails MAX_FAILURES jobs in a row, is wedged
+  and recycled: its QEMU and pypkjs processes are killed and the next
+  install boots a fresh one
+
+Emulators boot concurrently. pebble_tool records running emulators in
+pb-emulator.json in the temporary directory, rewriting the whole file on
+every launch, so each platform's pebble commands run with TMPDIR set to
+its own state directory (see state_dir()) and every platform has its own
+record to update. Ports are already chosen and flash state kept per
+platform. The pool reads that record to connect to the emulator's pypkjs
+directly.
+
+Emulators outlive the pool (the state directories are fixed per
+platform), so the next run starts warm too; --shutdown stops them. They
+are not the ones plain `pebble` commands or capture_emulator.py use.
+
+Usage:
+    from emulator_pool import EmulatorPool
+    pool = EmulatorPool(platforms, log_dir)
+    warm = await pool.acquire("chalk", timeout)  # Installed, connected, healthy
+    ...capture with warm.session...
+    pool.release("chalk", ok=True)
+
+    python3 emulator_pool.py              # Status of each platform's emulator
+    python3 emulator_pool.py --shutdown   # Stop them
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import tempfile
+from pathlib import Path
+
+from capture_emulator import EmulatorSession, app_keys, sdk_missing
+from layout import target_platforms
+
+# Paths
+PROJECT_DIR = Path(__file__).resolve().parent.parent.parent
+BUILD_DIR = PROJECT_DIR / "build"
+
+# Seconds allowed for one emulator launch and install
+INSTALL_TIMEOUT = 180
+
+# Seconds an emulator has to answer a ping before it counts as wedged
+HEALTH_TIMEOUT = 5
+
+# Failed jobs in a row before an emulator is recycled
+MAX_FAILURES = 2
+
+
+async def pebble_async(*args, env=None, timeout=None, log=None):
+    """
+    Run a pebble tool command without blocking the event loop.
+
+    Output is appended to the log file when given. The process is killed
+    if it outlives timeout or the calling task is cancelled.
+
+    Raises:
+        RuntimeError: If the command fails, times out or is not found
+    """
+    command = f"pebble {' '.join(args)}"
+    output = open(log, "a") if log else asyncio.subprocess.DEVNULL
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "pebble", *args, cwd=PROJECT_DIR, env=env,
+            stdout=output, stderr=asyncio.subprocess.STDOUT)
+    except FileNotFoundError:
+        raise RuntimeError("pebble tool not found: run inside the Pebble SDK environment")
+    finally:
+        if log:
+            output.close()
+
+    try:
+        returncode = await asyncio.wait_for(process.wait(), timeout)
+    except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+        process.kill()
+        await process.wait()
+        if isinstance(e, asyncio.CancelledError):
+            raise
+        raise RuntimeError(f"{command} timed out after {timeout}s")
+    if returncode != 0:
+        where = f" (see {log})" if log else ""
+        raise RuntimeError(f"{command} failed{where}")
+
+
+def build_stamp():
+    """Return the modification time of the newest .pbw, or None before a build."""
+    stamps = [path.stat().st_mtime_ns for path in BUILD_DIR.glob("*.pbw")]
+    return max(stamps) if stamps else None
+
+
+def state_dir(platform):
+    """Return the TMPDIR a platform's pebble commands run with, holding its emulator record."""
+    return Path(tempfile.gettempdir()) / f"pebble-capture-{platform}"
+
+
+def pid_running(pid):
+    """Whether a process ID belongs to a running process."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def emulator_info(platform):
+    """
+    Return pebble_tool's record of a platform's running emulator, or None.
+
+    Read from the platform's pb-emulator.json (see state_dir()), which
+    keeps an entry per SDK version; the one whose QEMU is alive wins.
+    """
+    try:
+        with open(state_dir(platform) / "pb-emulator.json") as f:
+            versions = json.load(f).get(platform, {})
+    except (OSError, ValueError):
+        return None
+    for info in versions.values():
+        if pid_running(info["qemu"]["pid"]):
+            return info
+    return None
+
+
+def emulator_pids(platform):
+    """Return the QEMU and pypkjs process IDs pebble_tool recorded for a platform."""
+    info = emulator_info(platform)
+    if not info:
+        return []
+    return [info[process]["pid"] for process in ("qemu", "pypkjs") if process in info]
+
+
+def kill_emulator(platform):
+    """
+    Kill a platform's QEMU and pypkjs processes.
+
+    Returns:
+        True if any were running
+    """
+    pids = emulator_pids(platform)
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except OSError:
+            pass
+    return bool(pids)
+
+
+def ping(session, timeout=HEALTH_TIMEOUT):
+    """Whether the watch answers a ping over a session's connection."""
+    from libpebble2.protocol.system import Ping, PingPong
+
+    try:
+        session.connection.send_and_read(PingPong(message=Ping(), cookie=random.getrandbits(32)),
+                                         PingPong, timeout=timeout)
+    except Exception:
+        return False
+    return True
+
+
+class WarmEmulator:
+    """One platform's emulator, its connection, and the build installed on it."""
+
+    def __init__(self, platform, log):
+        self.platform = platform
+        self.log = log
+        self.session = None
+        self.shown = None        # Digest of the frame on screen (see wait_for_frame())
+        self.installed = None    # build_stamp() of the installed build
+        self.failures = 0        # Failed jobs in a row
+        self.stale = False       # Watchface state unknown after a failed job
+        self.installs = 0
+        self.recycles = 0
+
+    def connect(self):
+        """
+        Open the connection to the emulator's pypkjs and wait for the face on screen.
+
+        Raises:
+            RuntimeError: If the platform has no running emulator
+        """
+        from libpebble2.communication.transports.websocket import WebsocketTransport
+
+        info = emulator_info(self.platform)
+        if info is None:
+            raise RuntimeError(f"{self.platform}: no running emulator recorded in {state_dir(self.platform)}")
+        transport = WebsocketTransport(f"ws://localhost:{info['pypkjs']['port']}/")
+        self.session = EmulatorSession(self.platform, transport)
+        try:
+            _, self.shown, _ = self.session.wait_for_frame()
+        except Exception:
+            self.disconnect()
+            raise
+
+    def disconnect(self):
+        """Close the connection, which also unblocks any call still using it."""
+        if self.session is not None:
+            self.session.close()
+        self.session = None
+
+    def relaunch(self):
+        """Restart the watchface without reinstalling it and wait for its first frame."""
+        from libpebble2.protocol.apps import AppRunState, AppRunStateStart
+
+        app_uuid, _ = app_keys()
+        self.session.connection.send_packet(AppRunState(data=AppRunStateStart(uuid=app_uuid)))
+        _, self.shown, _ = self.session.wait_for_frame()
+        self.stale = False
+
+    def recycle(self):
+        """Kill a wedged emulator; the next install boots a fresh one."""
+        self.disconnect()
+        kill_emulator(self.platform)
+        self.installed = None
+        self.failures = 0
+        self.stale = False
+        self.recycles += 1
+
+
+class EmulatorPool:
+    """One WarmEmulator per platform, handed out to capture jobs."""
+
+    def __init__(self, platforms, log_dir):
+        log_dir.mkdir(parents=True, exist_ok=True)
+        self.emulators = {platform: WarmEmulator(platform, log_dir / f"{platform}.log")
+                          for platform in platforms}
+
+    async def acquire(self, platform, timeout):
+        """
+        Return a platform's emulator ready for a job.
+
+        Recycles it if it is wedged, installs the build if it is newer than
+        the installed one, connects if needed, and relaunches the watchface
+        after a failed job. timeout bounds each blocking step.
+
+        Raises:
+            RuntimeError: If the install fails
+            asyncio.TimeoutError: If connecting or relaunching takes too long
+        """
+        warm = self.emulators[platform]
+        if warm.session is not None and not await asyncio.to_thread(ping, warm.session):
+            print(f"🔄 {platform}: not answering, recycling the emulator")
+            warm.recycle()
+        elif warm.failures >= MAX_FAILURES:
+            print(f"🔄 {platform}: {warm.failures} failed jobs in a row, recycling the emulator")
+            warm.recycle()
+
+        stamp = build_stamp()
+        if warm.installed is None or warm.installed != stamp:
+            warm.disconnect()
+            state_dir(platform).mkdir(parents=True, exist_ok=True)
+            env = {**os.environ, "TMPDIR": str(state_dir(platform))}
+            await pebble_async("install", "--emulator", platform, env=env,
+                               timeout=INSTALL_TIMEOUT, log=warm.log)
+            warm.installed = stamp
+            warm.installs += 1
+            warm.stale = False
+
+        if warm.session is None:
+            await asyncio.wait_for(asyncio.to_thread(warm.connect), timeout)
+        if warm.stale:
+            await asyncio.wait_for(asyncio.to_thread(warm.relaunch), timeout)
+        return warm
+
+    def release(self, platform, ok):
+        """
+        Hand a platform's emulator back after a job.
+
+        After a failure the connection is dropped (unblocking the job's
+        thread if it is stuck) and the watchface is relaunched before the
+        next job.
+        """
+        warm = self.emulators[platform]
+        if ok:
+            warm.failures = 0
+            return
+        warm.failures += 1
+        warm.stale = True
+        warm.disconnect()
+
+    def close(self):
+        """Close every connection, leaving the emulators running for the next run."""
+        for warm in self.emulators.values():
+            warm.disconnect()
+
+    def shutdown(self):
+        """Close every connection and stop every emulator."""
+        for warm in self.emulators.values():
+            warm.disconnect()
+            kill_emulator(warm.platform)
+
+
+def main():
+    platforms = target_platforms()
+
+    parser = argparse.ArgumentParser(description="Show or stop the warm capture emulators.")
+    parser.add_argument("--shutdown", action="store_true", help="stop every platform's emulator")
+    args = parser.parse_args()
+
+    missing = sdk_missing()
+    if missing:
+        print(f"❌ {missing} not found: run inside the Pebble SDK environment")
+        return 1
+
+    if args.shutdown:
+        for platform in platforms:
+            print(f"✅ {platform}: stopped" if kill_emulator(platform) else f"⏭️  {platform}: not running")
+        return 0
+
+    for platform in platforms:
+        pids = emulator_pids(platform)
+        print(f"  {platform}: {'running (pids ' + ', '.join(map(str, pids)) + ')' if pids else 'not running'}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -6,25 +6,48 @@ This approach bypasses the unreliable emulator screenshot process by
 directly compositing the watchface digit bitmaps into screenshots.
 
 Benefits:
-- Instant generation (<1 second)
+- Instant generation (<1 second for all 25 store screenshots)
 - 100% reliable, no emulator timing issues
 - Pixel-perfect accuracy
 - Easy to maintain and regenerate
 
 Usage:
-    python3 generate_screenshots_programmatic.py
+    python3 generate_screenshots_programmatic.py [--platform NAME ...] [--depth native|gray|rgb]
+    python3 generate_screenshots_programmatic.py --all-day [--output DIR] [--jobs N]
 
-Generates screenshots for aplite platform (144×168). For basalt, simply
-copy the aplite screenshots as they have identical display dimensions.
+Generates the store screenshots for every platform in appinfo.json
+targetPlatforms into store-assets/screenshots/<platform>/. Rendering is
+done by compositor.py (importable for in-memory use); digit placement
+comes from layout.py, which mirrors main_window_load() in
+src/main.c (including the padded quadrants on round displays), so chalk
+and emery no longer need an emulator.
+
+PNGs are written at the device's native colour depth by default: 1-bit
+for aplite/diorite and the Pebble 64-colour palette for basalt, chalk
+and emery (see pebble_palette.py). --depth gray or rgb writes 8-bit
+grayscale or 24-bit RGB instead.
+
+With --all-day, every minute of the day is rendered in both 12h and 24h
+mode (2880 frames) for each platform. Frames are composited into
+preallocated NumPy stacks and written to build/day-frames/<platform>/.
+PNG encoding dominates that run, so --jobs N shards the time × platform
+matrix across N worker processes (--jobs 0 uses every core).
 """
 
-from PIL import Image
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from compositor import BLANK, DEPTHS, display_digits, frame_image, render_frames
+from digit_atlas import digit_hashes
+from layout import platform_layout, target_platforms
+from manifest import Manifest, input_key
+
 # Paths
-RESOURCES = Path("resources/images")
-OUTPUT_DIR = Path("store-assets/screenshots/aplite")
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+PROJECT_DIR = Path(__file__).resolve().parent.parent.parent
+SCREENSHOTS_DIR = PROJECT_DIR / "store-assets" / "screenshots"
+DAY_OUTPUT_DIR = PROJECT_DIR / "build" / "day-frames"
 
 # Times to generate (hour, minute, is_24h, filename)
 TIMES = [
@@ -35,14 +58,26 @@ TIMES = [
     (23, 59, True, "23-59-24h"),   # 23:59 (24h mode)
 ]
 
-def load_digit(num):
-    """Load a digit image from resources."""
-    path = RESOURCES / f"digit_{num}.png"
-    if not path.exists():
-        raise FileNotFoundError(f"Digit image not found: {path}")
-    return Image.open(path)
+# Frames per unit of work when rendering the full day (2 hours of minutes)
+SHARD_SIZE = 120
+
+# Recorded in the render manifest; bump RENDER_VERSION whenever a change
+# to compositor.py alters rendered pixels so every output is regenerated
+TOOL_NAME = "generate_screenshots_programmatic"
+RENDER_VERSION = 2
+
+
+def day_times(is_24h):
+    """Return (hour, minute, is_24h, filename) entries for every minute of the day."""
+    suffix = "24h" if is_24h else "12h"
+    return [
+        (hour, minute, is_24h, f"{hour:02d}-{minute:02d}-{suffix}")
+        for hour in range(24)
+        for minute in range(60)
+    ]
+
 
-def generate_screenshot(hour, minute, is_24h, name):
+def generate_screenshot(hour, minute, is_24h, name, platform="aplite", depth="native"):
     """
     Generate a screenshot for a specific time.
 
@@ -51,75 +86,218 @@ def generate_screenshot(hour, minute, is_24h, name):
         minute: Minute (0-59)
         is_24h: Whether to use 24h format
         name: Output filename (without extension)
+        platform: Platform to render for
+        depth: Output colour depth (see frame_image())
 
     Returns:
         Path to generated screenshot
     """
-    # Convert hour based on format
-    if not is_24h:
-        hour = hour % 12
-        if hour == 0:
-            hour = 12
-
-    # Get digits
-    hour_tens = hour // 10
-    hour_ones = hour % 10
-    min_tens = minute // 10
-    min_ones = minute % 10
-
-    # Create black background (144x168 for aplite/basalt)
-    screenshot = Image.new('RGB', (144, 168), (0, 0, 0))
-
-    # Load digit images
-    digits = {
-        'hour_tens': load_digit(hour_tens),
-        'hour_ones': load_digit(hour_ones),
-        'min_tens': load_digit(min_tens),
-        'min_ones': load_digit(min_ones),
-    }
-
-    # Quadrant dimensions
-    # Top row: 72×83 (each quadrant)
-    # Bottom row: 72×84 (each quadrant)
-    # 1px padding between rows
-    quad_width = 72
-    quad_height_top = 83
-
-    # Place digits in 2×2 grid
-    # Top-left: hour tens (hide if 0 in 12h mode)
-    if not (not is_24h and hour_tens == 0):
-        screenshot.paste(digits['hour_tens'], (0, 0))
-
-    # Top-right: hour ones
-    screenshot.paste(digits['hour_ones'], (quad_width, 0))
-
-    # Bottom-left: minute tens (with 1px padding)
-    screenshot.paste(digits['min_tens'], (0, quad_height_top + 1))
-
-    # Bottom-right: minute ones
-    screenshot.paste(digits['min_ones'], (quad_width, quad_height_top + 1))
+    frame = render_frames([(hour, minute, is_24h, name)], platform)[0]
+    screenshot, params = frame_image(frame, platform, depth)
 
     # Save
-    output_path = OUTPUT_DIR / f"{name}.png"
-    screenshot.save(output_path)
+    output_dir = SCREENSHOTS_DIR / platform
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / f"{name}.png"
+    screenshot.save(output_path, **params)
 
     return output_path
 
+
+def write_shard(platform, times, output_dir, depth="native"):
+    """
+    Render and encode one shard of frames.
+
+    Runs in a worker process when --jobs is used, so each worker composites
+    its own frames and only the failure list travels back to the parent.
+
+    Returns:
+        List of (frame name, error message) for frames that failed to save
+    """
+    frames = render_frames(times, platform)
+    failures = []
+    for frame, (_, _, _, name) in zip(frames, times):
+        try:
+            image, params = frame_image(frame, platform, depth)
+            image.save(output_dir / f"{name}.png", **params)
+        except (OSError, ValueError) as e:
+            failures.append((f"{platform}/{name}", str(e)))
+    return failures
+
+
+def shard_label(platform, times):
+    """Describe a shard for progress output, e.g. 'aplite 00-00-12h..01-59-12h'."""
+    if len(times) == 1:
+        return f"{platform} {times[0][3]}"
+    return f"{platform} {times[0][3]}..{times[-1][3]}"
+
+
+def run_shards(shards, jobs=1, depth="native"):
+    """
+    Render and save (platform, times, output_dir) shards.
+
+    With jobs > 1 the shards are rendered and PNG-encoded on a process
+    pool; progress is still reported in shard order.
+
+    Returns:
+        (frames written, list of (frame name, error message) failures)
+    """
+    written = 0
+    failures = []
+    width = len(str(len(shards)))
+
+    def report(index, platform, shard_times, shard_failures):
+        nonlocal written
+        written += len(shard_times) - len(shard_failures)
+        failures.extend(shard_failures)
+        status = "✅" if not shard_failures else f"❌ {len(shard_failures)} failed"
+        print(f"[{index:>{width}}/{len(shards)}] {shard_label(platform, shard_times)} {status}")
+
+    if jobs == 1:
+        for index, (platform, shard_times, output_dir) in enumerate(shards, 1):
+            report(index, platform, shard_times,
+                   write_shard(platform, shard_times, output_dir, depth))
+        return written, failures
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(write_shard, platform, shard_times, output_dir, depth)
+                   for platform, shard_times, output_dir in shards]
+        for index, ((platform, shard_times, _), future) in enumerate(zip(shards, futures), 1):
+            try:
+                shard_failures = future.result()
+            except Exception as e:
+                # A crashed shard counts every one of its frames as failed
+                shard_failures = [(f"{platform}/{name}", f"{type(e).__name__}: {e}")
+                                  for _, _, _, name in shard_times]
+            report(index, platform, shard_times, shard_failures)
+
+    return written, failures
+
+
+def frame_key(base_key, hour, minute, is_24h, hashes):
+    """
+    Return the manifest key and shown digits of one frame.
+
+    Only the hashes of digits actually on screen go into the key, so a
+    changed digit PNG only invalidates frames that show it.
+    """
+    digits = [num for num in display_digits(hour, minute, is_24h) if num != BLANK]
+    return input_key(base_key, hour, minute, is_24h, [hashes[num] for num in digits]), digits
+
+
+def render_matrix(targets, jobs=1, depth="native", shard_size=SHARD_SIZE, force=False):
+    """
+    Render (platform, times, output_dir) targets, skipping unchanged outputs.
+
+    Every frame's inputs (digit PNG bytes, layout, time, platform, colour
+    depth and RENDER_VERSION) are hashed and compared with the render
+    manifest. Stale frames are split into shards of shard_size frames.
+
+    Returns:
+        (frames written, frames skipped, list of (frame name, error) failures)
+    """
+    manifest = Manifest()
+    hashes = digit_hashes()
+
+    for num in manifest.changed_digits(hashes):
+        print(f"🔄 digit_{num}.png changed: {len(manifest.frames_using(num))} recorded outputs show it")
+
+    shards = []
+    pending = []
+    skipped = 0
+    for platform, times, output_dir in targets:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        base_key = input_key(TOOL_NAME, RENDER_VERSION, platform_layout(platform), depth)
+
+        stale = []
+        for entry in times:
+            hour, minute, is_24h, name = entry
+            key, digits = frame_key(base_key, hour, minute, is_24h, hashes)
+            output_path = output_dir / f"{name}.png"
+            if not force and manifest.is_current(output_path, key):
+                skipped += 1
+                continue
+            stale.append(entry)
+            pending.append((f"{platform}/{name}", output_path, key, digits))
+
+        for start in range(0, len(stale), shard_size):
+            shards.append((platform, stale[start:start + shard_size], output_dir))
+
+    written, failures = run_shards(shards, jobs, depth)
+
+    failed = {name for name, _ in failures}
+    for name, output_path, key, digits in pending:
+        if name not in failed:
+            manifest.record(output_path, key, digits)
+    manifest.digit_hashes = hashes
+    manifest.save()
+
+    return written, skipped, failures
+
+
+def render_store(platforms, jobs=1, force=False, depth="native"):
+    """Render the TIMES store screenshots for each platform."""
+    targets = [(platform, TIMES, SCREENSHOTS_DIR / platform) for platform in platforms]
+    return render_matrix(targets, jobs, depth, shard_size=len(TIMES), force=force)
+
+
+def render_day(platforms, output_root=DAY_OUTPUT_DIR, jobs=1, force=False, depth="native"):
+    """Render every minute of the day in 12h and 24h mode for each platform."""
+    times = day_times(is_24h=False) + day_times(is_24h=True)
+    targets = [(platform, times, output_root / platform) for platform in platforms]
+    return render_matrix(targets, jobs, depth, force=force)
+
+
 def main():
     """Generate all screenshots."""
-    print("Generating screenshots from digit images...")
-    print("=" * 50)
+    platforms = target_platforms()
 
-    for hour, minute, is_24h, name in TIMES:
-        output_path = generate_screenshot(hour, minute, is_24h, name)
-        print(f"✅ Generated: {name}.png")
+    parser = argparse.ArgumentParser(description="Generate screenshots from digit images.")
+    parser.add_argument("--platform", action="append", choices=platforms, metavar="NAME",
+                        help=f"platform to render (repeatable; default: {' '.join(platforms)})")
+    parser.add_argument("--all-day", action="store_true",
+                        help="render every minute of the day (12h and 24h) instead of the store set")
+    parser.add_argument("--output", type=Path, default=DAY_OUTPUT_DIR,
+                        help=f"output root for --all-day frames (default: {DAY_OUTPUT_DIR})")
+    parser.add_argument("--jobs", type=int, default=1, metavar="N",
+                        help="render and encode shards on N processes (0 = all cores)")
+    parser.add_argument("--force", action="store_true",
+                        help="re-render every output, even if its inputs are unchanged")
+    parser.add_argument("--depth", choices=DEPTHS, default="native",
+                        help="output colour depth: native (1-bit / 64-colour palette), "
+                             "gray or rgb (default: native)")
+    args = parser.parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    platforms = args.platform or platforms
+
+    if args.all_day:
+        print(f"Rendering every minute of the day from digit images ({jobs} job(s))...")
+        print("=" * 50)
+        output = args.output
+        written, skipped, failures = render_day(platforms, output, jobs, args.force, args.depth)
+    else:
+        print("Generating screenshots from digit images...")
+        print("=" * 50)
+        output = SCREENSHOTS_DIR
+        written, skipped, failures = render_store(platforms, jobs, args.force, args.depth)
 
     print("=" * 50)
-    print(f"✅ Complete! All screenshots in: {OUTPUT_DIR}")
-    print()
-    print("Next steps:")
-    print("  1. Copy to basalt: cp store-assets/screenshots/aplite/*.png store-assets/screenshots/basalt/")
-    print("  2. Regenerate banner: python3 generate_banner.py")
+    if skipped:
+        print(f"⏭️  {skipped} unchanged output(s) skipped (use --force to re-render)")
+    if failures:
+        print(f"❌ {len(failures)} frame(s) failed:")
+        for name, error in failures:
+            print(f"  {name}: {error}")
+        return 1
+
+    print(f"✅ Complete! {written} {'frames' if args.all_day else 'screenshots'} in: {output}")
+    if not args.all_day:
+        print()
+        print("Next steps:")
+        print("  1. Review screenshots: ls store-assets/screenshots/*/")
+        print("  2. Regenerate banner: python3 tools/banner/generate_banner.py")
+    return 0
+
 
 if __name__ == "__main__":
-    main()
+    exit(main())
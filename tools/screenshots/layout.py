@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Watchface layout model mirroring main_window_load() in src/main.c.
+
+For every platform in appinfo.json targetPlatforms this computes where
+each digit bitmap lands on screen:
+
+- Rectangular displays: a 2×2 grid of bounds/2 quadrants
+- Round displays (PBL_ROUND): the same grid inset by 10px padding
+- The top row layers are 1px shorter (quadrant_height - 1)
+- Each BitmapLayer centres the 72×84 bitmap in its frame (C integer
+  division) and clips it to the frame, drawing from the bitmap's
+  top-left corner
+- Round displays only show a 180×180 disc (display_mask()); digit
+  pixels outside it are never drawn
+
+Usage:
+    from layout import platform_layout
+    layout = platform_layout("chalk")
+
+    python3 layout.py           # Print the layout of every platform
+"""
+
+import json
+from collections import namedtuple
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+# Paths
+PROJECT_DIR = Path(__file__).resolve().parent.parent.parent
+APPINFO = PROJECT_DIR / "appinfo.json"
+
+# Display geometry per Pebble platform: (width, height, is_round, is_color)
+DISPLAYS = {
+    "aplite": (144, 168, False, False),
+    "basalt": (144, 168, False, True),
+    "chalk": (180, 180, True, True),
+    "diorite": (144, 168, False, False),
+    "emery": (200, 228, False, True),
+}
+
+# Quadrant inset on round displays (the PBL_ROUND branch of main.c)
+ROUND_PADDING = 10
+
+# First visible column of each of the top 90 rows of the round 180×180
+# display, as in chalk emulator captures. Rows mirror top to bottom and
+# each row is visible from its inset to width - inset.
+ROUND_ROW_INSETS = (
+    76, 71, 66, 63, 60, 57, 55, 52, 50, 48, 46, 45, 43, 41, 40, 38, 37, 36,
+    34, 33, 32, 31, 29, 28, 27, 26, 25, 24, 23, 22, 22, 21, 20, 19, 18, 18,
+    17, 16, 15, 15, 14, 13, 13, 12, 12, 11, 10, 10, 9, 9, 8, 8, 7, 7,
+    7, 6, 6, 5, 5, 5, 4, 4, 4, 3, 3, 3, 2, 2, 2, 2, 2, 1,
+    1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+)
+
+# Digit bitmap size (resources/images/digit_N.png)
+BITMAP_WIDTH = 72
+BITMAP_HEIGHT = 84
+
+# A GRect: origin and size in screen pixels
+Rect = namedtuple("Rect", "x y w h")
+
+# Layer frames and clipped digit rectangles for one platform, both in
+# main.c order: hour tens, hour ones, minute tens, minute ones
+Layout = namedtuple("Layout", "platform width height is_round is_color frames quadrants")
+
+
+def c_div(a, b):
+    """Integer division truncating toward zero, like C."""
+    q = abs(a) // abs(b)
+    return q if (a >= 0) == (b > 0) else -q
+
+
+def target_platforms():
+    """Return the targetPlatforms list from appinfo.json."""
+    with open(APPINFO) as f:
+        return json.load(f)["targetPlatforms"]
+
+
+def layer_frames(width, height, is_round):
+    """
+    Return the four BitmapLayer frames created by main_window_load().
+
+    Args:
+        width: Window bounds width
+        height: Window bounds height
+        is_round: Whether PBL_ROUND is defined for the platform
+
+    Returns:
+        Four Rects: hour tens, hour ones, minute tens, minute ones
+    """
+    if is_round:
+        padding = ROUND_PADDING
+        quad_w = c_div(width - 2 * padding, 2)
+        quad_h = c_div(height - 2 * padding, 2)
+    else:
+        padding = 0
+        quad_w = c_div(width, 2)
+        quad_h = c_div(height, 2)
+
+    return (
+        Rect(padding, padding, quad_w, quad_h - 1),
+        Rect(padding + quad_w, padding, quad_w, quad_h - 1),
+        Rect(padding, padding + quad_h, quad_w, quad_h),
+        Rect(padding + quad_w, padding + quad_h, quad_w, quad_h),
+    )
+
+
+def bitmap_rect(frame, bitmap_w=BITMAP_WIDTH, bitmap_h=BITMAP_HEIGHT):
+    """
+    Return where a BitmapLayer draws its bitmap inside a frame.
+
+    Mirrors grect_align(GAlignCenter, clip=true): the bitmap is centred in
+    the frame, then the rectangle is clipped to the frame. The bitmap is
+    drawn from its top-left corner at the clipped origin.
+    """
+    x = frame.x + c_div(frame.w - bitmap_w, 2)
+    y = frame.y + c_div(frame.h - bitmap_h, 2)
+    left = max(x, frame.x)
+    top = max(y, frame.y)
+    right = min(x + bitmap_w, frame.x + frame.w)
+    bottom = min(y + bitmap_h, frame.y + frame.h)
+    return Rect(left, top, max(0, right - left), max(0, bottom - top))
+
+
+@lru_cache(maxsize=None)
+def display_mask(platform):
+    """
+    Return a read-only (height, width) bool array of the pixels a display shows.
+
+    Rectangular displays show every pixel; round ones only the disc given
+    by ROUND_ROW_INSETS.
+    """
+    width, height, is_round, _ = DISPLAYS[platform]
+    mask = np.ones((height, width), dtype=bool)
+    if is_round:
+        assert (width, height) == (2 * len(ROUND_ROW_INSETS),) * 2
+        insets = np.array(ROUND_ROW_INSETS + ROUND_ROW_INSETS[::-1])
+        columns = np.arange(width)
+        mask = (columns >= insets[:, None]) & (columns < width - insets[:, None])
+    mask.flags.writeable = False
+    return mask
+
+
+@lru_cache(maxsize=None)
+def platform_layout(platform):
+    """Return the Layout for a platform name (e.g. 'chalk')."""
+    if platform not in DISPLAYS:
+        raise ValueError(f"Unknown platform '{platform}' "
+                         f"(valid: {', '.join(DISPLAYS)})")
+
+    width, height, is_round, is_color = DISPLAYS[platform]
+    frames = layer_frames(width, height, is_round)
+    quadrants = tuple(bitmap_rect(frame) for frame in frames)
+    return Layout(platform, width, height, is_round, is_color, frames, quadrants)
+
+
+def main():
+    for platform in target_platforms():
+        layout = platform_layout(platform)
+        shape = "round" if layout.is_round else "rect"
+        color = "color" if layout.is_color else "b&w"
+        print(f"{platform}: {layout.width}×{layout.height} ({shape}, {color})")
+        for label, frame, quad in zip(("hour tens", "hour ones", "min tens", "min ones"),
+                                      layout.frames, layout.quadrants):
+            print(f"  {label:<9}  layer {frame.w}×{frame.h} at ({frame.x}, {frame.y})"
+                  f"  digit {quad.w}×{quad.h} at ({quad.x}, {quad.y})")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
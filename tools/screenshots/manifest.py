@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Content-addressed render manifest for incremental regeneration.
+
+Every generated output (screenshot, day frame, banner) is recorded with
+a key hashing everything it was made from: the bytes of the digit PNGs
+it shows, layout parameters, time, platform and tool version. A tool
+computes the key for each output it is about to write and skips the
+ones whose recorded key still matches.
+
+Each entry also lists the digits it shows, which gives a reverse index
+from digit to outputs. When digit_7.png changes only the outputs
+containing a 7 get new keys, and frames_using(7) says how many that is.
+
+The manifest lives in build/cache/render-manifest.json.
+
+Usage:
+    python3 manifest.py         # Summarise the manifest
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+# Paths
+PROJECT_DIR = Path(__file__).resolve().parent.parent.parent
+MANIFEST_PATH = PROJECT_DIR / "build" / "cache" / "render-manifest.json"
+
+# Bump when the manifest file layout changes
+MANIFEST_VERSION = 1
+
+
+def input_key(*parts):
+    """Hash JSON-serialisable input parts into a hex SHA-256 key."""
+    encoded = json.dumps(parts, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def output_name(path):
+    """Return the manifest name of an output: project-relative when possible."""
+    path = Path(path).resolve()
+    try:
+        return str(path.relative_to(PROJECT_DIR))
+    except ValueError:
+        return str(path)
+
+
+class Manifest:
+    """Recorded input keys of generated outputs, loaded from and saved to JSON."""
+
+    def __init__(self, path=MANIFEST_PATH):
+        self.path = Path(path)
+        self.outputs = {}
+        self.digit_hashes = []
+        self.load()
+
+    def load(self):
+        """Load the manifest, starting empty if it is missing or unreadable."""
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != MANIFEST_VERSION:
+            return
+        self.outputs = data.get("outputs", {})
+        self.digit_hashes = data.get("digit_hashes", [])
+
+    def save(self):
+        """Write the manifest atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({
+                "version": MANIFEST_VERSION,
+                "digit_hashes": self.digit_hashes,
+                "outputs": self.outputs,
+            }, f, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def is_current(self, path, key):
+        """
+        Whether an output was last written from the same inputs.
+
+        The file's size and mtime must also match what was recorded, so an
+        output replaced by something else (a checkout, another tool) is
+        treated as stale.
+        """
+        entry = self.outputs.get(output_name(path))
+        if entry is None or entry["key"] != key:
+            return False
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        return entry["stat"] == [stat.st_size, stat.st_mtime_ns]
+
+    def record(self, path, key, digits=()):
+        """Record that an output was just written from inputs hashing to key."""
+        stat = os.stat(path)
+        self.outputs[output_name(path)] = {
+            "key": key,
+            "digits": sorted(set(digits)),
+            "stat": [stat.st_size, stat.st_mtime_ns],
+        }
+
+    def frames_using(self, digit):
+        """Reverse index: names of recorded outputs that show a digit."""
+        return [name for name, entry in self.outputs.items() if digit in entry["digits"]]
+
+    def changed_digits(self, current_hashes):
+        """Return digits whose PNG hash differs from the last recorded run."""
+        if not self.digit_hashes:
+            return []
+        return [num for num, (old, new) in enumerate(zip(self.digit_hashes, current_hashes))
+                if old != new]
+
+
+def main():
+    manifest = Manifest()
+    if not manifest.outputs:
+        print(f"No manifest at {manifest.path}")
+        return 0
+
+    print(f"Manifest: {manifest.path}")
+    print(f"  {len(manifest.outputs)} outputs recorded")
+    for digit in range(10):
+        print(f"  digit {digit}: {len(manifest.frames_using(digit))} outputs")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Pebble display colour depths and precomputed quantisation tables.
+
+Colour platforms (basalt, chalk, emery) show the 64-colour GColor8
+palette: 2 bits per channel, with palette index 0bRRGGBB. Black & white
+platforms (aplite, diorite) are 1-bit. Rendered frames are 8-bit gray,
+so each depth is a single lookup table indexed by the gray value.
+
+Usage:
+    from pebble_palette import native_image
+    image, params = native_image(frame, is_color=True)
+    image.save("frame.png", **params)
+"""
+
+import numpy as np
+from PIL import Image
+
+# Channel intensities of the 2-bit GColor8 levels
+LEVELS = (0x00, 0x55, 0xAA, 0xFF)
+
+# All 64 GColor8 colours as (r, g, b), indexed by 0bRRGGBB
+PEBBLE64 = [(LEVELS[i >> 4 & 3], LEVELS[i >> 2 & 3], LEVELS[i & 3]) for i in range(64)]
+
+# Nearest 2-bit level of each 8-bit channel value
+CHANNEL_TO_LEVEL = ((np.arange(256) + 42) // 85).astype(np.uint8)
+
+# Gray value -> GColor8 index of the matching gray (r = g = b)
+GRAY_TO_INDEX = CHANNEL_TO_LEVEL * 0b010101
+
+# Gray value -> on/off pixel of a 1-bit display
+GRAY_TO_BIT = np.arange(256) >= 128
+
+
+def png_bits(colors):
+    """Smallest PNG palette bit depth that can index this many colours."""
+    for bits in (1, 2, 4):
+        if colors <= 1 << bits:
+            return bits
+    return 8
+
+
+def native_image(frame, is_color):
+    """
+    Quantise an 8-bit gray frame to the platform's display depth.
+
+    Colour frames become a palette image holding only the GColor8 entries
+    in use, so PNGs are written at the smallest bit depth. Black & white
+    frames become a bilevel ('1') image.
+
+    Returns:
+        (image, save params) to pass to Image.save
+    """
+    if not is_color:
+        return Image.fromarray(GRAY_TO_BIT[frame]), {}
+
+    # Only GColor8 entries of gray values present in the frame are kept;
+    # folding the compaction into the 256-entry table keeps it one lookup
+    present = np.bincount(frame.ravel(), minlength=256) > 0
+    used = np.unique(GRAY_TO_INDEX[present])
+    remap = np.zeros(64, dtype=np.uint8)
+    remap[used] = np.arange(len(used))
+
+    image = Image.fromarray(remap[GRAY_TO_INDEX][frame], "P")
+    image.putpalette([channel for index in used for channel in PEBBLE64[index]])
+    return image, {"bits": png_bits(len(used))}
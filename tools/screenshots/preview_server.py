@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Local HTTP preview server over the in-memory compositor.
+
+Serves any platform and time on demand, so digit edits can be checked in
+a browser without regenerating screenshots:
+
+    /render?platform=chalk&time=09:41&fmt=24h   PNG of one platform
+    /?time=09:41&fmt=12h                        Page showing every platform
+
+Optional query parameters: fmt (12h or 24h, default 12h) and depth
+(native, gray or rgb, default native; see compositor.frame_image()).
+
+Encoded PNGs are kept in an in-process LRU cache, and each response
+carries an ETag so browsers revalidate with a 304. The digit PNGs are
+stat()ed on every request; when one changes on disk the cache is
+dropped and the next request renders the new digits.
+
+Usage:
+    python3 preview_server.py [--port 8000] [--bind 127.0.0.1] [--cache-size 512]
+"""
+
+import argparse
+import hashlib
+import html
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock
+from urllib.parse import parse_qs, urlsplit
+
+from animate_preview import parse_time
+from compositor import DEPTHS, render_png
+from digit_atlas import source_hash
+from layout import target_platforms
+
+# Default number of encoded PNGs kept in memory
+CACHE_SIZE = 512
+
+# Content hash of the digit PNGs the cache was built from
+_digits = {"hash": None}
+_digits_lock = Lock()
+
+
+def current_digits():
+    """
+    Return the content hash of the digit PNGs, clearing the PNG cache when
+    they changed on disk since the last request.
+
+    source_hash() only re-reads the PNGs when their size or mtime changed.
+    """
+    digest = source_hash()
+    with _digits_lock:
+        if digest != _digits["hash"]:
+            cached_png.cache_clear()
+            _digits["hash"] = digest
+        return digest
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def cached_png(digits, platform, hour, minute, is_24h, depth):
+    """
+    Render and encode one frame.
+
+    digits is the digit source hash, so entries from older digits can
+    never be returned even if a request races a cache clear.
+
+    Returns:
+        (PNG bytes, ETag)
+    """
+    png = render_png(platform, hour, minute, is_24h, depth)
+    return png, '"' + hashlib.sha256(png).hexdigest()[:32] + '"'
+
+
+def index_page(platforms, query):
+    """Return an HTML page with one /render image per platform."""
+    value = html.escape(query.get("time", "10:08"))
+    fmt = query.get("fmt", "12h")
+    rows = "\n".join(
+        f'<figure><img src="/render?platform={p}&amp;time={value}&amp;fmt={html.escape(fmt)}">'
+        f"<figcaption>{p}</figcaption></figure>"
+        for p in platforms
+    )
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Superlegible preview</title>
+<style>
+body {{ background: #222; color: #ccc; font-family: sans-serif; }}
+figure {{ display: inline-block; margin: 1em; text-align: center; }}
+img {{ image-rendering: pixelated; zoom: 2; }}
+</style></head><body>
+<form><input name="time" value="{value}"> <select name="fmt">
+<option{' selected' if fmt == '12h' else ''}>12h</option>
+<option{' selected' if fmt == '24h' else ''}>24h</option>
+</select> <button>Show</button></form>
+{rows}
+</body></html>
+"""
+
+
+class PreviewHandler(BaseHTTPRequestHandler):
+    """Serves /render PNGs and the / index page."""
+
+    platforms = ()
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        if url.path == "/":
+            self.send_body(200, "text/html; charset=utf-8",
+                           index_page(self.platforms, query).encode())
+        elif url.path == "/render":
+            self.send_render(query)
+        else:
+            self.send_error(404, "Not found")
+
+    def send_render(self, query):
+        platform = query.get("platform", "")
+        fmt = query.get("fmt", "12h")
+        depth = query.get("depth", "native")
+        if platform not in self.platforms:
+            self.send_error(400, f"Unknown platform '{platform}' (valid: {', '.join(self.platforms)})")
+            return
+        if fmt not in ("12h", "24h"):
+            self.send_error(400, f"fmt must be 12h or 24h, got '{fmt}'")
+            return
+        if depth not in DEPTHS:
+            self.send_error(400, f"depth must be one of {', '.join(DEPTHS)}, got '{depth}'")
+            return
+        try:
+            hour, minute = parse_time(query.get("time", "10:08"))
+        except argparse.ArgumentTypeError as e:
+            self.send_error(400, str(e))
+            return
+
+        start = time.perf_counter()
+        digits = current_digits()
+        hits = cached_png.cache_info().hits
+        png, etag = cached_png(digits, platform, hour, minute, fmt == "24h", depth)
+        self.lookup = ("hit" if cached_png.cache_info().hits > hits else "miss",
+                       (time.perf_counter() - start) * 1000)
+
+        if etag in self.headers.get("If-None-Match", ""):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_body(200, "image/png", png, etag)
+
+    def send_body(self, status, content_type, body, etag=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")  # Always revalidate via ETag
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_request(self, code="-", size="-"):
+        lookup = getattr(self, "lookup", None)
+        suffix = f" [{lookup[0]} {lookup[1]:.3f} ms]" if lookup else ""
+        self.log_message('"%s" %s%s', self.requestline, code, suffix)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve watchface previews over HTTP.")
+    parser.add_argument("--port", type=int, default=8000, help="port to listen on (default: 8000)")
+    parser.add_argument("--bind", default="127.0.0.1", help="address to bind (default: 127.0.0.1)")
+    parser.add_argument("--cache-size", type=int, default=CACHE_SIZE,
+                        help=f"encoded PNGs kept in memory (default: {CACHE_SIZE})")
+    args = parser.parse_args()
+
+    global cached_png
+    if args.cache_size != CACHE_SIZE:
+        cached_png = lru_cache(maxsize=args.cache_size)(cached_png.__wrapped__)
+
+    PreviewHandler.platforms = tuple(target_platforms())
+    current_digits()  # Hash the digits before the first request
+
+    server = ThreadingHTTPServer((args.bind, args.port), PreviewHandler)
+    print(f"🔄 Serving previews on http://{args.bind}:{args.port}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    print("\n✅ Stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,28 @@
+"""
+Tests for the streaming GIF writer in animate_preview.py.
+
+Usage:
+    python3 -m pytest tools/screenshots/test_animate_preview.py
+"""
+
+import numpy as np
+import pytest
+from PIL import Image, ImageSequence
+
+from animate_preview import export_preview, minute_range, stream_frames
+
+
+@pytest.mark.parametrize("platform", ["aplite", "chalk"])
+def test_gif_frames_match_renders(tmp_path, platform):
+    times = minute_range((9, 55), (10, 5), False)
+    output_path = tmp_path / f"{platform}.gif"
+    export_preview(platform, times, output_path, "gif", fps=10)
+
+    with Image.open(output_path) as image:
+        assert image.info["loop"] == 0
+        assert image.info["duration"] == 100
+        decoded = [np.asarray(frame.convert("L")) for frame in ImageSequence.Iterator(image)]
+    rendered = [frame.copy() for frame in stream_frames(times, platform)]
+    assert len(decoded) == len(times)
+    for got, expected in zip(decoded, rendered):
+        assert np.array_equal(got, expected)
@@ -0,0 +1,54 @@
+"""
+Tests for the AppMessage reply handling in capture_emulator.py.
+
+libpebble2's AppMessageService broadcasts "ack" and "nack" as
+handler(transaction_id, uuid), dispatched as handler(*args) on its event
+thread; broadcast() below does the same.
+
+Usage:
+    python3 -m pytest tools/screenshots/test_capture_emulator.py
+"""
+
+import threading
+import uuid
+
+import pytest
+
+from capture_emulator import PendingSends
+
+APP_UUID = uuid.UUID("00000000-0000-0000-0000-000000000000")
+
+
+def broadcast(handler, *args):
+    """Call a handler on another thread the way libpebble2's event handler does."""
+    thread = threading.Thread(target=handler, args=args)
+    thread.start()
+    thread.join()
+
+
+def test_ack_before_wait():
+    pending = PendingSends()
+    broadcast(pending.on_ack, 7, APP_UUID)
+    pending.wait(7, timeout=1)
+
+
+def test_ack_while_waiting():
+    pending = PendingSends()
+    timer = threading.Timer(0.05, pending.on_ack, args=(3, APP_UUID))
+    timer.start()
+    pending.wait(3, timeout=5)
+    timer.join()
+
+
+def test_nack_fails_at_once():
+    pending = PendingSends()
+    broadcast(pending.on_nack, 9, APP_UUID)
+    with pytest.raises(RuntimeError, match="rejected"):
+        pending.wait(9, timeout=5)
+
+
+def test_other_transaction_times_out():
+    pending = PendingSends()
+    broadcast(pending.on_ack, 1, APP_UUID)
+    with pytest.raises(TimeoutError):
+        pending.wait(2, timeout=0.05)
@@ -0,0 +1,44 @@
+"""
+Tests for batch cropping in crop_screenshots.py.
+
+Usage:
+    python3 -m pytest tools/screenshots/test_crop_screenshots.py
+"""
+
+import numpy as np
+from PIL import Image
+
+from crop_cache import GeometryCache
+from crop_screenshots import PROJECT_DIR, run_jobs
+
+STORE_SCREENSHOTS = PROJECT_DIR / "store-assets" / "screenshots"
+
+
+def fake_capture(source, path, pad=12):
+    """Save a store screenshot inside a flat grey window frame, as a capture."""
+    with Image.open(source) as image:
+        screen = np.asarray(image.convert("RGB"))
+    height, width, _ = screen.shape
+    window = np.full((height + 2 * pad, width + 2 * pad, 3), 200, dtype=np.uint8)
+    window[pad:pad + height, pad:pad + width] = screen
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.fromarray(window).save(path)
+    return screen
+
+
+def test_corrupt_capture_fails_alone(tmp_path):
+    names = ["09-41-12h", "10-08-12h"]
+    screens = [fake_capture(STORE_SCREENSHOTS / "basalt" / f"{name}.png", tmp_path / "basalt" / f"{name}.png")
+               for name in names]
+    broken = tmp_path / "basalt" / "broken.png"
+    broken.write_bytes(b"\x89PNG\r\n\x1a\n truncated")
+    jobs = [(tmp_path / "basalt" / f"{names[0]}.png", 144, 168), (broken, 144, 168),
+            (tmp_path / "basalt" / f"{names[1]}.png", 144, 168)]
+
+    results = run_jobs(jobs, workers=1, cache=GeometryCache(tmp_path / "crop-geometry.json"))
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[1].path == broken and results[1].error
+    for (path, _, _), screen in zip([jobs[0], jobs[2]], screens):
+        with Image.open(path) as cropped:
+            assert np.array_equal(np.asarray(cropped.convert("RGB")), screen)
@@ -0,0 +1,77 @@
+"""
+Tests for the in-process digit caches in digit_atlas.py and compositor.py.
+
+Usage:
+    python3 -m pytest tools/screenshots/test_digit_atlas.py
+"""
+
+import os
+import shutil
+
+import numpy as np
+import pytest
+from PIL import Image
+
+import compositor
+import digit_atlas
+from digit_atlas import DIGIT_COUNT, load_atlas, source_hash
+
+
+@pytest.fixture
+def digits(tmp_path, monkeypatch):
+    """Point the atlas at a copy of the digit PNGs with empty caches."""
+    resources = tmp_path / "images"
+    resources.mkdir()
+    for num in range(DIGIT_COUNT):
+        shutil.copy(digit_atlas.RESOURCES / f"digit_{num}.png", resources)
+    monkeypatch.setattr(digit_atlas, "RESOURCES", resources)
+    monkeypatch.setattr(digit_atlas, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(digit_atlas, "_loaded", {})
+    monkeypatch.setattr(digit_atlas, "_source_hashes", {})
+    monkeypatch.setattr(compositor, "_tiles", {})
+    return resources
+
+
+def edit_digit(resources, num):
+    """Change one pixel of a digit and move its mtime forward."""
+    path = resources / f"digit_{num}.png"
+    with Image.open(path) as image:
+        edited = image.convert("LA")
+    edited.putpixel((0, 0), (255, 255))
+    edited.save(path)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_source_hash_rehashes_only_on_change(digits, monkeypatch):
+    calls = []
+    digit_hashes = digit_atlas.digit_hashes
+    monkeypatch.setattr(digit_atlas, "digit_hashes", lambda: calls.append(1) or digit_hashes())
+
+    first = source_hash()
+    for _ in range(5):
+        assert source_hash() == first
+    assert len(calls) == 1
+
+    edit_digit(digits, 3)
+    assert source_hash() != first
+    assert len(calls) == 2
+
+
+def test_only_current_digits_are_kept(digits):
+    load_atlas()
+    compositor.quadrant_tiles("basalt")
+    compositor.quadrant_tiles("chalk")
+    before = source_hash()
+
+    edit_digit(digits, 7)
+    atlas = load_atlas()
+    compositor.quadrant_tiles("basalt")
+
+    after = source_hash()
+    assert list(digit_atlas._loaded) == [after]
+    assert list(digit_atlas._source_hashes.values()) == [after]
+    assert list(compositor._tiles) == [("basalt", after)]
+    assert after != before
+    assert atlas[7, 0, 0, 1] == 255
+    assert np.array_equal(load_atlas(), atlas)